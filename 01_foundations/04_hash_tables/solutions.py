@@ -5,6 +5,10 @@ Complete solutions with explanations for all exercises.
 Study the approach and complexity analysis for each problem.
 """
 
+import threading
+from collections import deque
+from contextlib import nullcontext
+
 # ============================================================================
 # EXERCISE 1: Basic Hash Table Operations
 # ============================================================================
@@ -765,6 +769,58 @@ class Logger:
         return False
 
 
+class ExpiringLogger:
+    """
+    Rate-limiting logger whose memory is bounded by recent messages.
+
+    Logger keeps every distinct message forever. Here each printed message
+    is also appended to a timestamp-ordered queue; entries older than the
+    suppression window are evicted from both the queue and the hash map,
+    so only messages printed in the last `window` seconds are stored.
+
+    Approach:
+    - Hash map: message → last printed timestamp
+    - Queue: (timestamp, message) in print order (timestamps non-decreasing)
+    - Before each check, pop expired entries from the queue front
+    - Optional lock makes should_print_message safe across threads
+
+    Example: logger = ExpiringLogger(window=10, thread_safe=True)
+    """
+
+    def __init__(self, window=10, thread_safe=False):
+        self.window = window
+        self.message_times = {}
+        self.recent = deque()
+        self.lock = threading.Lock() if thread_safe else nullcontext()
+
+    def _expire(self, timestamp):
+        """Drop messages printed at or before timestamp - window."""
+        cutoff = timestamp - self.window
+        while self.recent and self.recent[0][0] <= cutoff:
+            old_time, message = self.recent.popleft()
+            if self.message_times.get(message) == old_time:
+                del self.message_times[message]
+
+    def should_print_message(self, timestamp, message):
+        """
+        Time: O(1) amortized
+        Space: O(R) where R is messages printed in the last window seconds
+        """
+        with self.lock:
+            self._expire(timestamp)
+
+            # Anything still stored was printed less than window seconds ago
+            if message in self.message_times:
+                return False
+
+            self.message_times[message] = timestamp
+            self.recent.append((timestamp, message))
+            return True
+
+    def __len__(self):
+        return len(self.message_times)
+
+
 class TwoSum:
     """
     Design a data structure for two sum queries.
@@ -844,6 +900,13 @@ if __name__ == "__main__":
     print("Logger 3:", logger.should_print_message(3, "foo"))
     print("Logger 11:", logger.should_print_message(11, "foo"))
 
+    expiring = ExpiringLogger(window=10, thread_safe=True)
+    for t in range(100):
+        expiring.should_print_message(t, f"msg-{t}")
+    print("Expiring logger stored messages:", len(expiring))  # Only last 10 s
+    print("Expiring logger 95:", expiring.should_print_message(95, "msg-90"))
+    print("Expiring logger 100:", expiring.should_print_message(100, "msg-90"))
+
     two_sum = TwoSum()
     two_sum.add(1)
     two_sum.add(3)
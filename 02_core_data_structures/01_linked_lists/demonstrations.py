@@ -5,6 +5,21 @@ This file demonstrates common linked list patterns and operations.
 Study each function and its use case.
 """
 
+import gc
+import hashlib
+import heapq
+import math
+import os
+import random
+import struct
+import tempfile
+import time
+import tracemalloc
+from array import array
+from collections import deque
+from contextlib import contextmanager
+from itertools import islice, repeat
+
 
 # ============================================================================
 # NODE DEFINITION
@@ -14,8 +29,13 @@ Study each function and its use case.
 class ListNode:
     """
     Basic building block of a linked list.
+
+    __slots__ drops the per-instance __dict__: smaller nodes and faster
+    attribute access when chains hold millions of nodes.
     """
 
+    __slots__ = ("val", "next")
+
     def __init__(self, val=0, next=None):
         self.val = val
         self.next = next
@@ -29,24 +49,61 @@ class ListNode:
 # ============================================================================
 
 
+@contextmanager
+def gc_paused():
+    """Pause the cyclic garbage collector, restoring its previous state"""
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
 def create_linked_list(arr):
     """
-    Create linked list from array.
+    Create linked list from array (or any iterable).
 
     Time: O(n)
     Space: O(n) - creates n nodes
+
+    Bulk build: map() allocates and links the nodes in C-level loops
+    instead of a Python loop doing current.next / current = current.next
+    per step. The cyclic GC is paused meanwhile - n fresh nodes would
+    otherwise trigger a collection every few hundred allocations.
     """
-    if not arr:
-        return None
+    with gc_paused():
+        nodes = list(map(ListNode, arr))
+        if not nodes:
+            return None
+        # nodes[i].next = nodes[i + 1], drained by a zero-length deque
+        deque(map(setattr, nodes, repeat("next"), islice(nodes, 1, None)), maxlen=0)
+    return nodes[0]
 
-    head = ListNode(arr[0])
-    current = head
 
-    for i in range(1, len(arr)):
-        current.next = ListNode(arr[i])
-        current = current.next
+def iter_list_nodes(head):
+    """
+    Lazy view over the nodes of a chain.
 
-    return head
+    Time: O(n) to exhaust
+    Space: O(1)
+    """
+    while head:
+        yield head
+        head = head.next
+
+
+def iter_list_values(head):
+    """
+    Lazy view over the values of a chain.
+
+    Time: O(n) to exhaust
+    Space: O(1)
+    """
+    while head:
+        yield head.val
+        head = head.next
 
 
 def print_list(head):
@@ -56,12 +113,7 @@ def print_list(head):
     Time: O(n)
     Space: O(1)
     """
-    values = []
-    current = head
-    while current:
-        values.append(str(current.val))
-        current = current.next
-    print(" → ".join(values) + " → None")
+    print(" → ".join(map(str, iter_list_values(head))) + " → None")
 
 
 def list_to_array(head):
@@ -71,12 +123,7 @@ def list_to_array(head):
     Time: O(n)
     Space: O(n)
     """
-    result = []
-    current = head
-    while current:
-        result.append(current.val)
-        current = current.next
-    return result
+    return list(iter_list_values(head))
 
 
 # ============================================================================
@@ -331,6 +378,151 @@ def find_cycle_start(head):
     return slow
 
 
+def _next_node(node):
+    return node.next
+
+
+def _brent(f, x0):
+    """
+    Brent's cycle detection on x0, f(x0), f(f(x0)), ... (None ends it).
+
+    Returns: (mu, lam, start, evaluations of f) or None without a cycle
+    """
+    evaluations = 0
+    if x0 is None:
+        return None
+
+    # Phase 1: the tortoise teleports to the hare at powers of two; the
+    # hare's distance since the last teleport is the cycle length
+    power = lam = 1
+    tortoise = x0
+    hare = f(x0)
+    evaluations += 1
+    while hare is not None and tortoise != hare:
+        if power == lam:
+            tortoise = hare
+            power *= 2
+            lam = 0
+        hare = f(hare)
+        evaluations += 1
+        lam += 1
+    if hare is None:
+        return None
+
+    # Phase 2: pointers lam apart meet at the cycle start after mu steps
+    tortoise = hare = x0
+    for _ in range(lam):
+        hare = f(hare)
+    mu = 0
+    while tortoise != hare:
+        tortoise = f(tortoise)
+        hare = f(hare)
+        mu += 1
+    evaluations += lam + 2 * mu
+
+    return mu, lam, tortoise, evaluations
+
+
+def _floyd(f, x0):
+    """Floyd's tortoise-and-hare with the same return shape as _brent"""
+    evaluations = 0
+    if x0 is None:
+        return None
+
+    tortoise = f(x0)
+    hare = f(tortoise) if tortoise is not None else None
+    evaluations += 2
+    while hare is not None and tortoise != hare:
+        tortoise = f(tortoise)
+        hare = f(hare)
+        hare = f(hare) if hare is not None else None
+        evaluations += 3
+    if hare is None:
+        return None
+
+    mu = 0
+    tortoise = x0
+    while tortoise != hare:
+        tortoise = f(tortoise)
+        hare = f(hare)
+        mu += 1
+    evaluations += 2 * mu
+
+    lam = 1
+    hare = f(tortoise)
+    while tortoise != hare:
+        hare = f(hare)
+        lam += 1
+    evaluations += lam
+
+    return mu, lam, tortoise, evaluations
+
+
+def find_cycle_brent(head):
+    """
+    Find cycle start and length (Brent's algorithm).
+
+    Time: O(mu + lam) - fewer steps than Floyd's, no double-speed pointer
+    Space: O(1)
+
+    Approach:
+    1. Hare walks ahead; tortoise jumps to the hare whenever the step count
+       hits a power of two. They meet once the window covers the cycle,
+       and the steps since the last jump give the cycle length lam.
+    2. Start one pointer lam nodes ahead of the other from head - they
+       meet at the cycle start.
+
+    Example: [1→2→3→4→2] (4 points back to 2) → (node 2, 3)
+    Returns: (start_node, cycle_length), or (None, 0) without a cycle
+    """
+    found = _brent(_next_node, head)
+    if found is None:
+        return None, 0
+    _, lam, start, _ = found
+    return start, lam
+
+
+def brent_cycle(f, x0):
+    """
+    Cycle of a functional iteration x0 → f(x0) → f(f(x0)) → ...
+
+    Time: O(mu + lam) evaluations of f
+    Space: O(1)
+
+    Example: ID remapping {0: 1, 1: 2, 2: 3, 3: 1} from 0 → (1, 3, 1)
+             (tail of 1 step, then the cycle 1 → 2 → 3 → 1)
+    Returns: (mu, lam, start) - tail length, cycle length and the first
+             value on the cycle, or None if f returns None (the iteration ends)
+    """
+    found = _brent(f, x0)
+    return found[:3] if found else None
+
+
+def benchmark_cycle_detection(shapes=((10, 10**5), (10**5, 10), (10**5, 10**5))):
+    """
+    Floyd vs Brent on x → x + 1 with a tail of mu and a cycle of lam.
+
+    Returns: [(mu, lam, floyd_evals, brent_evals, floyd_s, brent_s)]
+    """
+    rows = []
+    for mu, lam in shapes:
+        last = mu + lam - 1
+
+        def f(x):
+            return x + 1 if x < last else mu
+
+        row = [mu, lam]
+        timings = []
+        for detect in (_floyd, _brent):
+            start = time.perf_counter()
+            found = detect(f, 0)
+            timings.append(time.perf_counter() - start)
+            assert found[:2] == (mu, lam)
+            row.append(found[3])
+        rows.append(tuple(row + timings))
+    return rows
+
+
 def get_nth_from_end(head, n):
     """
     Get nth node from end.
@@ -594,6 +786,144 @@ def remove_duplicates_unsorted(head):
     return head
 
 
+_MASK64 = (1 << 64) - 1
+
+
+def _mix64(x):
+    """splitmix64 finalizer - a bijection on 64-bit ints, so no collisions"""
+    x = (x ^ (x >> 30)) * 0xBF58476D1CE4E5B9 & _MASK64
+    x = (x ^ (x >> 27)) * 0x94D049BB133111EB & _MASK64
+    return x ^ (x >> 31)
+
+
+def _stable_bytes(item):
+    """Type-tagged byte encoding of item (equal values → equal bytes)"""
+    if isinstance(item, int):
+        return b"i" + item.to_bytes(item.bit_length() // 8 + 1, "little", signed=True)
+    if isinstance(item, float):
+        return b"f" + struct.pack("<d", item)
+    if isinstance(item, str):
+        return b"s" + item.encode("utf-8", "surrogatepass")
+    if isinstance(item, bytes):
+        return b"b" + item
+    return b"r" + repr(item).encode("utf-8", "backslashreplace")
+
+
+def _bloom_hashes(item):
+    """
+    Two independent 64-bit hashes of item for double hashing.
+
+    Not hash(item): CPython maps distinct values to the same hash
+    (hash(-1) == hash(-2), ints equal mod 2**61 - 1), which would make
+    those values always collide. Ints within 64 bits are mixed directly;
+    other values go through BLAKE2b of a stable byte encoding.
+    """
+    if isinstance(item, float) and item.is_integer():
+        item = int(item)  # 1.0 == 1, as in a set
+    if isinstance(item, int) and -(1 << 63) <= item < 1 << 63:
+        h1 = _mix64(item & _MASK64)
+        return h1, _mix64(h1 ^ 0x9E3779B97F4A7C15)
+    digest = hashlib.blake2b(_stable_bytes(item), digest_size=16).digest()
+    return int.from_bytes(digest[:8], "little"), int.from_bytes(digest[8:], "little")
+
+
+class BloomFilter:
+    """
+    Probabilistic set: no false negatives, false positives at ~error_rate.
+
+    Space: m = -n·ln(p) / ln(2)^2 bits for n expected items at error rate p
+           (~9.6 bits per item at 1%, vs ~60+ bytes per entry in a set)
+    Time: O(k) per add / lookup with k = (m / n)·ln(2) hash probes
+
+    Approach: k bit positions per item from double hashing
+    h1 + i·h2 (mod m), with h1, h2 from _bloom_hashes.
+
+    Limit: values other than int, float, str and bytes are hashed through
+    repr(), so equal values must have equal repr (true for tuples of those).
+    """
+
+    def __init__(self, expected_items, error_rate=0.01):
+        if not 0 < error_rate < 1:
+            raise ValueError("error_rate must be between 0 and 1")
+        expected_items = max(1, expected_items)
+        self.size = max(8, math.ceil(-expected_items * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.size / expected_items * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def _positions(self, item):
+        h1, h2 = _bloom_hashes(item)
+        h2 |= 1
+        for i in range(self.hashes):
+            yield (h1 + i * h2) % self.size
+
+    def __contains__(self, item):
+        bits = self.bits
+        return all(bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(item))
+
+    def add(self, item):
+        """Insert item. Returns False if it was (probably) already present."""
+        bits = self.bits
+        new = False
+        for pos in self._positions(item):
+            mask = 1 << (pos & 7)
+            if not bits[pos >> 3] & mask:
+                bits[pos >> 3] |= mask
+                new = True
+        if new:
+            self.count += 1
+        return new
+
+    def memory_bytes(self):
+        """Bytes held by the bit array"""
+        return len(self.bits)
+
+    def estimated_fp_rate(self):
+        """(1 - e^(-k·n/m))^k for the n items added so far"""
+        return (1 - math.exp(-self.hashes * self.count / self.size)) ** self.hashes
+
+
+def remove_duplicates_approx(head, bloom):
+    """
+    Remove duplicates from unsorted list using a Bloom filter.
+
+    Time: O(n·k)
+    Space: O(m) bits - fixed by the filter, not by the number of distinct values
+
+    Approach: Same walk as remove_duplicates_unsorted with the set swapped
+    for a Bloom filter. Duplicates are always removed; a false positive may
+    also drop a first occurrence (rate ≈ bloom.estimated_fp_rate()).
+
+    Example: bloom = BloomFilter(expected_items=1000, error_rate=0.001)
+             [1→3→2→1→4] → [1→3→2→4]
+    """
+    if not head:
+        return None
+
+    bloom.add(head.val)
+    current = head
+
+    while current.next:
+        if bloom.add(current.next.val):
+            current = current.next
+        else:
+            current.next = current.next.next
+
+    return head
+
+
+def dedupe_approx(iterable, bloom):
+    """
+    Lazily yield first occurrences from any iterable (e.g. a huge stream).
+
+    Time: O(k) per item
+    Space: O(m) bits
+    """
+    for item in iterable:
+        if bloom.add(item):
+            yield item
+
+
 def add_two_numbers(l1, l2):
     """
     Add two numbers represented by linked lists (digits in reverse order).
@@ -626,6 +956,1000 @@ def add_two_numbers(l1, l2):
     return dummy.next
 
 
+# ============================================================================
+# ADVANCED: SKIP LIST (ORDERED MAP)
+# ============================================================================
+
+
+class SkipNode:
+    """
+    Skip list node with per-node level arrays sized to its own height.
+
+    forward[i] - next node at level i
+    span[i]    - level-0 steps from this node to forward[i]
+                 (to the end of the list when forward[i] is None)
+    """
+
+    __slots__ = ("key", "value", "forward", "span")
+
+    def __init__(self, key, value, level):
+        self.key = key
+        self.value = value
+        self.forward = [None] * level
+        self.span = array("q", bytes(8 * level))
+
+
+class SkipList:
+    """
+    Sorted map on a skip list - a sorted linked list with express lanes.
+
+    Time: O(log n) expected for insert, delete, search, rank, select
+    Space: O(n) expected (1 / (1 - p) forward pointers per node)
+
+    Approach: Each node is promoted to the next level with probability p.
+    Searches drop down from the top lane, so only O(log n) nodes are visited.
+    Spans count how many level-0 nodes each pointer skips, which gives
+    rank (position of a key) and select (key at a position) for free.
+
+    Example: keys [1, 3, 5, 7] → rank(5) = 2, select(3) = (7, value)
+    """
+
+    MAX_LEVEL = 32
+
+    def __init__(self, p=0.25, seed=None):
+        self.p = p
+        self.rng = random.Random(seed)
+        self.head = SkipNode(None, None, self.MAX_LEVEL)
+        self.level = 1
+        self.length = 0
+
+    def _random_level(self):
+        level = 1
+        while level < self.MAX_LEVEL and self.rng.random() < self.p:
+            level += 1
+        return level
+
+    def __len__(self):
+        return self.length
+
+    def __contains__(self, key):
+        node = self._lower_bound(key)
+        return node is not None and node.key == key
+
+    def __iter__(self):
+        """Lazy in-order iteration over (key, value)"""
+        node = self.head.forward[0]
+        while node:
+            yield node.key, node.value
+            node = node.forward[0]
+
+    def _lower_bound(self, key):
+        """First node with node.key >= key (or None)"""
+        node = self.head
+        for i in reversed(range(self.level)):
+            while node.forward[i] and node.forward[i].key < key:
+                node = node.forward[i]
+        return node.forward[0]
+
+    def search(self, key, default=None):
+        """Value stored under key, or default"""
+        node = self._lower_bound(key)
+        if node is not None and node.key == key:
+            return node.value
+        return default
+
+    def insert(self, key, value=None):
+        """
+        Insert or update key. Returns True if the key was new.
+
+        update[i] is the last node before key on level i and rank[i] its
+        position; both are needed to splice the node in and fix the spans.
+        """
+        update = [self.head] * self.MAX_LEVEL
+        rank = [0] * self.MAX_LEVEL
+        node = self.head
+
+        for i in reversed(range(self.level)):
+            rank[i] = rank[i + 1] if i + 1 < self.level else 0
+            while node.forward[i] and node.forward[i].key < key:
+                rank[i] += node.span[i]
+                node = node.forward[i]
+            update[i] = node
+
+        candidate = node.forward[0]
+        if candidate is not None and candidate.key == key:
+            candidate.value = value
+            return False
+
+        level = self._random_level()
+        if level > self.level:
+            for i in range(self.level, level):
+                self.head.span[i] = self.length
+            self.level = level
+
+        new_node = SkipNode(key, value, level)
+        for i in range(level):
+            prev = update[i]
+            new_node.forward[i] = prev.forward[i]
+            prev.forward[i] = new_node
+            new_node.span[i] = prev.span[i] - (rank[0] - rank[i])
+            prev.span[i] = rank[0] - rank[i] + 1
+
+        # Lanes above the new node now skip one more node
+        for i in range(level, self.level):
+            update[i].span[i] += 1
+
+        self.length += 1
+        return True
+
+    def delete(self, key):
+        """Remove key. Returns True if it was present."""
+        update = [self.head] * self.MAX_LEVEL
+        node = self.head
+
+        for i in reversed(range(self.level)):
+            while node.forward[i] and node.forward[i].key < key:
+                node = node.forward[i]
+            update[i] = node
+
+        target = node.forward[0]
+        if target is None or target.key != key:
+            return False
+
+        for i in range(self.level):
+            if update[i].forward[i] is target:
+                update[i].span[i] += target.span[i] - 1
+                update[i].forward[i] = target.forward[i]
+            else:
+                update[i].span[i] -= 1
+
+        while self.level > 1 and self.head.forward[self.level - 1] is None:
+            self.level -= 1
+
+        self.length -= 1
+        return True
+
+    def rank(self, key):
+        """Number of keys strictly less than key (0-based index if present)"""
+        node = self.head
+        traversed = 0
+        for i in reversed(range(self.level)):
+            while node.forward[i] and node.forward[i].key < key:
+                traversed += node.span[i]
+                node = node.forward[i]
+        return traversed
+
+    def select(self, index):
+        """(key, value) at 0-based position index"""
+        if index < 0:
+            index += self.length
+        if not 0 <= index < self.length:
+            raise IndexError("skip list index out of range")
+
+        target = index + 1
+        node = self.head
+        traversed = 0
+        for i in reversed(range(self.level)):
+            while node.forward[i] and traversed + node.span[i] <= target:
+                traversed += node.span[i]
+                node = node.forward[i]
+            if traversed == target:
+                return node.key, node.value
+
+        raise IndexError("skip list index out of range")
+
+    def range(self, lo=None, hi=None):
+        """Lazily yield (key, value) with lo <= key < hi"""
+        node = self.head.forward[0] if lo is None else self._lower_bound(lo)
+        while node and (hi is None or node.key < hi):
+            yield node.key, node.value
+            node = node.forward[0]
+
+    @classmethod
+    def from_sorted(cls, items, p=0.25, seed=None):
+        """
+        Bulk build from (key, value) pairs with strictly increasing keys.
+
+        Time: O(n) - each node is appended after the current tail of every
+        level it reaches, no searching needed.
+        """
+        skip = cls(p, seed)
+        tails = [skip.head] * cls.MAX_LEVEL
+        tail_rank = [0] * cls.MAX_LEVEL
+        position = 0
+        last = None
+
+        for key, value in items:
+            if position and not last < key:
+                raise ValueError("keys must be strictly increasing")
+            last = key
+            position += 1
+
+            level = skip._random_level()
+            node = SkipNode(key, value, level)
+            for i in range(level):
+                tails[i].forward[i] = node
+                tails[i].span[i] = position - tail_rank[i]
+                tails[i] = node
+                tail_rank[i] = position
+            skip.level = max(skip.level, level)
+
+        # Pointers to the end span the rest of the list
+        for i in range(cls.MAX_LEVEL):
+            tails[i].span[i] = position - tail_rank[i]
+
+        skip.length = position
+        return skip
+
+
+# ============================================================================
+# ADVANCED: K-WAY MERGE
+# ============================================================================
+
+
+def iter_run_file(path, parse=int):
+    """Lazily yield parsed lines of a sorted run file (one value per line)"""
+    with open(path) as f:
+        for line in f:
+            line = line.rstrip("\n")
+            if line:
+                yield parse(line)
+
+
+def write_run_file(path, values):
+    """Write sorted values to a run file, one per line"""
+    with open(path, "w") as f:
+        for value in values:
+            f.write(f"{value}\n")
+
+
+def _as_iterator(source, parse):
+    if source is None or isinstance(source, ListNode):
+        return iter_list_values(source)
+    if isinstance(source, (str, bytes, os.PathLike)):
+        return iter_run_file(source, parse)
+    return iter(source)
+
+
+def merge_k_sorted(sources, key=None, dedupe=False, parse=int):
+    """
+    Lazily merge k sorted sources into one sorted stream.
+
+    Time: O(n log k)
+    Space: O(k) - one pending value per source in the heap
+
+    Sources may be ListNode chains, any iterable, or paths to sorted run
+    files (parsed line by line with parse). With dedupe=True, values whose
+    key equals the previously emitted key are skipped. Ties keep source
+    order, so the merge is stable.
+
+    Example: [1→4→5], [1, 3, 4], [2, 6] → 1, 1, 2, 3, 4, 4, 5, 6
+    """
+    heap = []
+    for index, source in enumerate(sources):
+        it = _as_iterator(source, parse)
+        for value in it:
+            heap.append((value if key is None else key(value), index, value, it))
+            break
+    heapq.heapify(heap)
+
+    last_key = None
+    emitted = False
+
+    while heap:
+        item_key, index, value, it = heap[0]
+
+        if not (dedupe and emitted and item_key == last_key):
+            yield value
+            last_key = item_key
+            emitted = True
+
+        for value in it:
+            heapq.heapreplace(heap, (value if key is None else key(value), index, value, it))
+            break
+        else:
+            heapq.heappop(heap)
+
+
+def merge_k_sorted_lists(lists):
+    """
+    Merge k sorted ListNode chains by relinking their nodes.
+
+    Time: O(n log k)
+    Space: O(k)
+
+    Approach: Min-heap holds the current head of each list; pop the
+    smallest, append it, push its successor. Pairwise merging would be O(nk).
+
+    Example: [1→4→5], [1→3→4], [2→6] → [1→1→2→3→4→4→5→6]
+    """
+    heap = [(node.val, i, node) for i, node in enumerate(lists) if node]
+    heapq.heapify(heap)
+
+    dummy = ListNode(0)
+    current = dummy
+
+    while heap:
+        _, i, node = heap[0]
+        current.next = node
+        current = node
+        if node.next:
+            heapq.heapreplace(heap, (node.next.val, i, node.next))
+        else:
+            heapq.heappop(heap)
+
+    current.next = None
+    return dummy.next
+
+
+# ============================================================================
+# ADVANCED: CHUNKED-LIMB BIG NUMBERS
+# ============================================================================
+
+# Non-negative integers as base 10^9 limbs, least significant first (same
+# order as add_two_numbers). Each limb fits an unsigned 32-bit array slot,
+# so 9 digits cost 4 bytes instead of 9 ListNodes.
+LIMB_BASE = 10**9
+LIMB_DIGITS = 9
+KARATSUBA_THRESHOLD = 32  # limbs
+
+
+def _limbs(values):
+    """array('I') with high zero limbs stripped (zero is an empty array)"""
+    limbs = array("I", values)
+    while limbs and limbs[-1] == 0:
+        limbs.pop()
+    return limbs
+
+
+def limbs_from_digits(digits):
+    """
+    Digit list (least significant first) → limbs.
+
+    Example: [2, 4, 3] (342) → array('I', [342])
+    """
+    values = []
+    for i in range(0, len(digits), LIMB_DIGITS):
+        chunk = digits[i : i + LIMB_DIGITS]
+        values.append(int("".join(map(str, reversed(chunk)))))
+    return _limbs(values)
+
+
+def limbs_to_digits(limbs):
+    """Limbs → digit list (least significant first)"""
+    if not limbs:
+        return [0]
+    digits = []
+    for limb in limbs:
+        for _ in range(LIMB_DIGITS):
+            limb, digit = divmod(limb, 10)
+            digits.append(digit)
+    while len(digits) > 1 and digits[-1] == 0:
+        digits.pop()
+    return digits
+
+
+def limbs_from_linked_list(head):
+    """Digit-per-node chain (as used by add_two_numbers) → limbs"""
+    return limbs_from_digits(list_to_array(head))
+
+
+def limbs_to_linked_list(limbs):
+    """Limbs → digit-per-node chain"""
+    return create_linked_list(limbs_to_digits(limbs))
+
+
+def limb_add(a, b):
+    """
+    Add two limb numbers.
+
+    Time: O(max(n, m) / 9)
+    Space: O(max(n, m) / 9)
+    """
+    if len(a) < len(b):
+        a, b = b, a
+    result = array("I", a)
+    carry = 0
+
+    for i in range(len(b)):
+        total = result[i] + b[i] + carry
+        if total >= LIMB_BASE:
+            result[i] = total - LIMB_BASE
+            carry = 1
+        else:
+            result[i] = total
+            carry = 0
+
+    i = len(b)
+    while carry:
+        if i == len(result):
+            result.append(1)
+            break
+        total = result[i] + 1
+        if total == LIMB_BASE:
+            result[i] = 0
+        else:
+            result[i] = total
+            carry = 0
+        i += 1
+
+    return result
+
+
+def limb_sub(a, b):
+    """
+    Subtract b from a (requires a >= b).
+
+    Time: O(n / 9)
+    Space: O(n / 9)
+    """
+    if limb_compare(a, b) < 0:
+        raise ValueError("limb_sub result would be negative")
+
+    result = array("I", a)
+    borrow = 0
+
+    for i in range(len(b)):
+        total = result[i] - b[i] - borrow
+        if total < 0:
+            result[i] = total + LIMB_BASE
+            borrow = 1
+        else:
+            result[i] = total
+            borrow = 0
+
+    i = len(b)
+    while borrow:
+        if result[i]:
+            result[i] -= 1
+            borrow = 0
+        else:
+            result[i] = LIMB_BASE - 1
+        i += 1
+
+    while result and result[-1] == 0:
+        result.pop()
+    return result
+
+
+def limb_compare(a, b):
+    """-1, 0 or 1 as a <, ==, > b (limbs must be normalized)"""
+    if len(a) != len(b):
+        return -1 if len(a) < len(b) else 1
+    for i in reversed(range(len(a))):
+        if a[i] != b[i]:
+            return -1 if a[i] < b[i] else 1
+    return 0
+
+
+def _schoolbook_mul(a, b):
+    """O(n * m) long multiplication"""
+    if not a or not b:
+        return array("I")
+
+    result = [0] * (len(a) + len(b))
+    for i, x in enumerate(a):
+        if not x:
+            continue
+        carry = 0
+        k = i
+        for y in b:
+            carry, result[k] = divmod(result[k] + x * y + carry, LIMB_BASE)
+            k += 1
+        result[k] += carry
+
+    return _limbs(result)
+
+
+def _shift(limbs, count):
+    """Multiply by LIMB_BASE ** count"""
+    if not limbs:
+        return limbs
+    return array("I", bytes(4 * count)) + limbs
+
+
+def limb_mul(a, b):
+    """
+    Multiply two limb numbers.
+
+    Time: O(n^1.585) via Karatsuba, schoolbook below KARATSUBA_THRESHOLD
+    Space: O(n)
+
+    Approach: Split a = a1·B^h + a0, b = b1·B^h + b0, then
+    a·b = z2·B^2h + (z1 - z2 - z0)·B^h + z0 with only three recursive
+    products: z0 = a0·b0, z2 = a1·b1, z1 = (a0 + a1)(b0 + b1).
+    """
+    if min(len(a), len(b)) <= KARATSUBA_THRESHOLD:
+        return _schoolbook_mul(a, b)
+
+    half = max(len(a), len(b)) // 2
+    a0, a1 = _limbs(a[:half]), a[half:]
+    b0, b1 = _limbs(b[:half]), b[half:]
+
+    z0 = limb_mul(a0, b0)
+    z2 = limb_mul(a1, b1)
+    z1 = limb_sub(limb_sub(limb_mul(limb_add(a0, a1), limb_add(b0, b1)), z2), z0)
+
+    return limb_add(limb_add(_shift(z2, 2 * half), _shift(z1, half)), z0)
+
+
+def benchmark_limb_numbers(digits=10**6, seed=0):
+    """
+    Add two numbers of the given digit count with add_two_numbers on
+    digit-per-node chains and with limb_add.
+
+    Returns: {name: (build_seconds, add_seconds, peak_bytes)}
+    """
+    rng = random.Random(seed)
+    x = [rng.randrange(10) for _ in range(digits)]
+    y = [rng.randrange(10) for _ in range(digits)]
+    results = {}
+    answers = {}
+
+    for name, build, add in (
+        ("digit nodes", create_linked_list, add_two_numbers),
+        ("limbs", limbs_from_digits, limb_add),
+    ):
+        tracemalloc.start()
+        start = time.perf_counter()
+        a, b = build(x), build(y)
+        built = time.perf_counter()
+        answers[name] = add(a, b)
+        done = time.perf_counter()
+        results[name] = (built - start, done - built, tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+        del a, b
+
+    assert list_to_array(answers["digit nodes"]) == limbs_to_digits(answers["limbs"])
+    return results
+
+
+# ============================================================================
+# ADVANCED: ROPE (BALANCED CHUNKED SEQUENCE)
+# ============================================================================
+
+
+class RopeNode:
+    """
+    Treap node holding a compact chunk (str or list slice) of the sequence.
+
+    size     - elements in this subtree
+    reversed - lazy flag: subtree content is stored mirrored
+    """
+
+    __slots__ = ("chunk", "left", "right", "size", "priority", "reversed")
+
+    def __init__(self, chunk, priority):
+        self.chunk = chunk
+        self.left = None
+        self.right = None
+        self.size = len(chunk)
+        self.priority = priority
+        self.reversed = False
+
+
+def _rope_size(node):
+    return node.size if node else 0
+
+
+def _rope_update(node):
+    node.size = len(node.chunk) + _rope_size(node.left) + _rope_size(node.right)
+
+
+def _rope_push(node):
+    """Apply a pending reversal one level down"""
+    if node.reversed:
+        node.left, node.right = node.right, node.left
+        node.chunk = node.chunk[::-1]
+        for child in (node.left, node.right):
+            if child:
+                child.reversed = not child.reversed
+        node.reversed = False
+
+
+def _rope_merge(a, b):
+    """Concatenate two treaps - O(log n)"""
+    if not a or not b:
+        return a or b
+    if a.priority > b.priority:
+        _rope_push(a)
+        a.right = _rope_merge(a.right, b)
+        _rope_update(a)
+        return a
+    _rope_push(b)
+    b.left = _rope_merge(a, b.left)
+    _rope_update(b)
+    return b
+
+
+def _rope_split(node, k):
+    """Split into (first k elements, rest) - O(log n + chunk size)"""
+    if not node:
+        return None, None
+
+    _rope_push(node)
+    left_size = _rope_size(node.left)
+    chunk_len = len(node.chunk)
+
+    if k <= left_size:
+        left, right = _rope_split(node.left, k)
+        node.left = right
+        _rope_update(node)
+        return left, node
+
+    if k >= left_size + chunk_len:
+        left, right = _rope_split(node.right, k - left_size - chunk_len)
+        node.right = left
+        _rope_update(node)
+        return node, right
+
+    # Split inside this chunk: the tail becomes its own node with the same
+    # priority, taking over the right subtree (heap order is preserved)
+    offset = k - left_size
+    tail = RopeNode(node.chunk[offset:], node.priority)
+    tail.right = node.right
+    _rope_update(tail)
+
+    node.chunk = node.chunk[:offset]
+    node.right = None
+    _rope_update(node)
+    return node, tail
+
+
+class Rope:
+    """
+    Balanced rope over a str or list, stored as an implicit treap of chunks.
+
+    Time: O(log n) expected for concat, split, insert, delete, index and
+    reverse (plus O(chunk_size) to cut a chunk); O(n) to build
+    Space: O(n)
+
+    Approach: Nodes are ordered by position, not key; subtree sizes locate
+    an index. Reversal flips a lazy flag on one subtree instead of
+    relinking nodes like reverse_between.
+
+    Example: Rope("hello world").reverse(0, 5) → "olleh world"
+    """
+
+    def __init__(self, seq=(), chunk_size=64, seed=None):
+        self.chunk_size = chunk_size
+        self.rng = random.Random(seed)
+        self.text = isinstance(seq, str)
+        self.root = self._build(seq)
+
+    def _build(self, seq):
+        """
+        Build a treap from seq in O(n) - chunks are already in order, so a
+        stack-based Cartesian tree construction replaces n inserts.
+        """
+        stack = []
+        for i in range(0, len(seq), self.chunk_size):
+            node = RopeNode(seq[i : i + self.chunk_size], self.rng.random())
+            last = None
+            while stack and stack[-1].priority < node.priority:
+                last = stack.pop()
+                _rope_update(last)
+            node.left = last
+            if stack:
+                stack[-1].right = node
+            stack.append(node)
+
+        while stack:
+            last = stack.pop()
+            _rope_update(last)
+        return last if seq else None
+
+    def _range(self, start, stop):
+        return slice(start, stop).indices(len(self))[:2]
+
+    def __len__(self):
+        return _rope_size(self.root)
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("rope index out of range")
+
+        node = self.root
+        while True:
+            _rope_push(node)
+            left_size = _rope_size(node.left)
+            if index < left_size:
+                node = node.left
+            elif index < left_size + len(node.chunk):
+                return node.chunk[index - left_size]
+            else:
+                index -= left_size + len(node.chunk)
+                node = node.right
+
+    def __iter__(self):
+        """Lazy in-order stream of elements, one chunk at a time"""
+        stack = []
+        node = self.root
+        while stack or node:
+            while node:
+                _rope_push(node)
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            yield from node.chunk
+            node = node.right
+
+    def __str__(self):
+        return "".join(map(str, self))
+
+    def concat(self, other):
+        """Append other's content (other becomes empty) - O(log n)"""
+        self.root = _rope_merge(self.root, other.root)
+        other.root = None
+        return self
+
+    def split(self, index):
+        """Keep [:index] in this rope, return a new rope with [index:]"""
+        index = self._range(index, None)[0]
+        self.root, right = _rope_split(self.root, index)
+        rest = Rope((), self.chunk_size)
+        rest.text = self.text
+        rest.root = right
+        return rest
+
+    def insert(self, index, seq):
+        """Insert seq before position index"""
+        index = self._range(index, None)[0]
+        left, right = _rope_split(self.root, index)
+        self.root = _rope_merge(_rope_merge(left, self._build(seq)), right)
+        return self
+
+    def delete(self, start, stop):
+        """Remove elements [start:stop]"""
+        start, stop = self._range(start, stop)
+        left, rest = _rope_split(self.root, start)
+        _, right = _rope_split(rest, max(0, stop - start))
+        self.root = _rope_merge(left, right)
+        return self
+
+    def reverse(self, start=0, stop=None):
+        """Reverse elements [start:stop] in place"""
+        start, stop = self._range(start, stop)
+        left, rest = _rope_split(self.root, start)
+        middle, right = _rope_split(rest, max(0, stop - start))
+        if middle:
+            middle.reversed = not middle.reversed
+        self.root = _rope_merge(_rope_merge(left, middle), right)
+        return self
+
+    def rotate_right(self, k):
+        """Move the last k elements to the front"""
+        n = len(self)
+        if n:
+            self.root, tail = _rope_split(self.root, n - k % n)
+            self.root = _rope_merge(tail, self.root)
+        return self
+
+    def compact(self):
+        """Rebuild with full chunks after many small edits - O(n)"""
+        items = list(self)
+        self.root = self._build("".join(items) if self.text else items)
+        return self
+
+
+# ============================================================================
+# ADVANCED: PERSISTENT LIST AND STACK
+# ============================================================================
+
+
+class PersistentNode:
+    """
+    Immutable cons cell. Never mutated after creation, so any number of
+    list versions can share it. Has val/next like ListNode, so helpers such
+    as list_to_array and print_list work on it directly.
+    """
+
+    __slots__ = ("val", "next", "length")
+
+    def __init__(self, val, next=None):
+        self.val = val
+        self.next = next
+        self.length = 1 + (next.length if next else 0)
+
+    def __repr__(self):
+        return f"PersistentNode({self.val})"
+
+
+class PersistentList:
+    """
+    Persistent singly linked list with structural sharing.
+
+    Time: O(1) prepend, first, rest and len; O(n) iteration
+    Space: O(1) per new version - old versions stay valid and share the tail
+
+    Example: a = PersistentList([2, 3]); b = a.prepend(1)
+             → a is still [2, 3], b is [1, 2, 3], both share the 2 → 3 nodes
+    """
+
+    __slots__ = ("head",)
+
+    def __init__(self, values=()):
+        head = None
+        for val in reversed(list(values)):
+            head = PersistentNode(val, head)
+        self.head = head
+
+    @classmethod
+    def _from_node(cls, node):
+        version = cls.__new__(cls)
+        version.head = node
+        return version
+
+    @classmethod
+    def from_linked_list(cls, head):
+        """Copy a ListNode chain (e.g. from create_linked_list) - O(n)"""
+        return cls(list_to_array(head))
+
+    def to_linked_list(self):
+        """Mutable ListNode copy - O(n)"""
+        return create_linked_list(list(self))
+
+    def prepend(self, val):
+        """New version with val in front"""
+        return self._from_node(PersistentNode(val, self.head))
+
+    def first(self):
+        if self.head is None:
+            raise IndexError("first of empty list")
+        return self.head.val
+
+    def rest(self):
+        """New version without the first element"""
+        if self.head is None:
+            raise IndexError("rest of empty list")
+        return self._from_node(self.head.next)
+
+    def __len__(self):
+        return self.head.length if self.head else 0
+
+    def __iter__(self):
+        node = self.head
+        while node:
+            yield node.val
+            node = node.next
+
+    def __repr__(self):
+        return f"PersistentList({list(self)})"
+
+
+class PersistentStack:
+    """
+    Persistent stack on top of PersistentList.
+
+    Time: O(1) push, pop, peek, len
+    Space: O(1) per version
+
+    Example: s1 = PersistentStack().push(1).push(2)
+             value, s0 = s1.pop() → value = 2, s1 still holds [2, 1]
+    """
+
+    __slots__ = ("items",)
+
+    def __init__(self, items=None):
+        self.items = items if items is not None else PersistentList()
+
+    def push(self, val):
+        return PersistentStack(self.items.prepend(val))
+
+    def pop(self):
+        """Return (top value, stack without it)"""
+        if not self.items.head:
+            raise IndexError("pop from empty stack")
+        return self.items.first(), PersistentStack(self.items.rest())
+
+    def peek(self):
+        if not self.items.head:
+            raise IndexError("peek from empty stack")
+        return self.items.first()
+
+    def is_empty(self):
+        return self.items.head is None
+
+    def __len__(self):
+        return len(self.items)
+
+    def __iter__(self):
+        """Top to bottom"""
+        return iter(self.items)
+
+
+def benchmark_persistent_snapshots(n=1000):
+    """
+    Push n values and keep a snapshot after every push, by copying a Python
+    list, by copying a ListNode chain, and with PersistentStack.
+
+    Returns: {name: peak_bytes}
+    """
+    results = {}
+
+    tracemalloc.start()
+    current, snapshots = [], []
+    for i in range(n):
+        current.append(i)
+        snapshots.append(list(current))
+    results["list copies"] = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    del current, snapshots
+
+    tracemalloc.start()
+    current, snapshots = [], []
+    for i in range(n):
+        current.append(i)
+        snapshots.append(create_linked_list(current))
+    results["ListNode copies"] = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    del current, snapshots
+
+    tracemalloc.start()
+    stack, snapshots = PersistentStack(), []
+    for i in range(n):
+        stack = stack.push(i)
+        snapshots.append(stack)
+    results["persistent"] = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return results
+
+
+# ============================================================================
+# BENCHMARK: LIST ↔ CHAIN CONVERSION
+# ============================================================================
+
+
+def benchmark_list_conversion(n=10**6):
+    """
+    Convert n values to a chain and back with per-step Python loops (the
+    classic helpers) and with create_linked_list / list_to_array.
+
+    Returns: {name: seconds}, plus "bytes/node" for ListNode
+    """
+    values = list(range(n))
+
+    def loop_build(arr):
+        head = ListNode(arr[0])
+        current = head
+        for i in range(1, len(arr)):
+            current.next = ListNode(arr[i])
+            current = current.next
+        return head
+
+    def loop_to_array(head):
+        result = []
+        current = head
+        while current:
+            result.append(current.val)
+            current = current.next
+        return result
+
+    results = {}
+    for name, build in (("build (loop)", loop_build), ("build (bulk)", create_linked_list)):
+        start = time.perf_counter()
+        head = build(values)
+        results[name] = time.perf_counter() - start
+        del head
+
+    head = create_linked_list(values)
+    for name, to_array in (("to array (loop)", loop_to_array), ("to array (iterator)", list_to_array)):
+        start = time.perf_counter()
+        assert to_array(head) == values
+        results[name] = time.perf_counter() - start
+    del head
+
+    tracemalloc.start()
+    head = create_linked_list(values)
+    results["bytes/node"] = tracemalloc.get_traced_memory()[0] / n
+    tracemalloc.stop()
+
+    return results
+
+
 # ============================================================================
 # TESTING
 # ============================================================================
@@ -678,3 +2002,86 @@ if __name__ == "__main__":
     head = remove_duplicates_sorted(head)
     print("After removing duplicates:", end=" ")
     print_list(head)
+
+    print("\n=== Skip List ===")
+    skip = SkipList.from_sorted([(k, str(k)) for k in [1, 3, 5, 7]], seed=1)
+    skip.insert(4, "4")
+    skip.delete(3)
+    print("Keys:", [key for key, _ in skip])  # [1, 4, 5, 7]
+    print("search(5):", skip.search(5))  # 5
+    print("rank(5):", skip.rank(5))  # 2
+    print("select(3):", skip.select(3))  # (7, '7')
+    print("range(2, 6):", list(skip.range(2, 6)))  # [(4, '4'), (5, '5')]
+
+    print("\n=== K-Way Merge ===")
+    lists = [create_linked_list([1, 4, 5]), create_linked_list([1, 3, 4]), create_linked_list([2, 6])]
+    print("Merged lists:", end=" ")
+    print_list(merge_k_sorted_lists(lists))
+    with tempfile.TemporaryDirectory() as tmp:
+        run_path = os.path.join(tmp, "run0.txt")
+        write_run_file(run_path, [0, 3, 9])
+        sources = [create_linked_list([1, 4, 5]), [1, 3, 4], run_path]
+        print("Merged stream:", list(merge_k_sorted(sources)))
+        print("Deduplicated:", list(merge_k_sorted(sources[1:], dedupe=True)))
+    words = [["kiwi", "banana"], ["fig", "apple", "cherry"]]
+    print("By length:", list(merge_k_sorted(words, key=len)))
+
+    print("\n=== Chunked-Limb Big Numbers ===")
+    a = limbs_from_linked_list(create_linked_list([2, 4, 3]))  # 342
+    b = limbs_from_linked_list(create_linked_list([5, 6, 4]))  # 465
+    print("342 + 465:", end=" ")
+    print_list(limbs_to_linked_list(limb_add(a, b)))  # 7 → 0 → 8
+    print("465 - 342:", limbs_to_digits(limb_sub(b, a)))  # [3, 2, 1]
+    print("342 * 465:", limbs_to_digits(limb_mul(a, b)))  # [0, 3, 0, 9, 5, 1]
+    for name, (build, add, peak) in benchmark_limb_numbers(10**5).items():
+        print(f"  {name}: build {build:.3f}s, add {add:.4f}s, peak {peak / 1e6:.1f} MB")
+
+    print("\n=== Rope ===")
+    rope = Rope("hello world", chunk_size=4, seed=0)
+    print("Reverse [0:5]:", rope.reverse(0, 5))  # olleh world
+    print("Insert at 5:", rope.insert(5, ", big"))  # olleh, big world
+    print("Delete [5:10]:", rope.delete(5, 10))  # olleh world
+    print("Rotate right 5:", rope.rotate_right(5))  # 'worldolleh '
+    tail = rope.split(5)
+    print("Split at 5:", repr(str(rope)), repr(str(tail)))
+    print("Concat:", rope.concat(tail), "| rope[6]:", rope[6])
+
+    print("\n=== Persistent List and Stack ===")
+    base = PersistentList.from_linked_list(create_linked_list([2, 3]))
+    extended = base.prepend(1)
+    print("base:", list_to_array(base.head), "extended:", list(extended))  # [2, 3] [1, 2, 3]
+    print("Shared tail:", extended.rest().head is base.head)  # True
+    s1 = PersistentStack().push(1).push(2)
+    top, s0 = s1.pop()
+    print("pop:", top, "| old version:", list(s1), "| new version:", list(s0))
+    for name, peak in benchmark_persistent_snapshots(500).items():
+        print(f"  {name}: peak {peak / 1e6:.2f} MB")
+
+    print("\n=== List ↔ Chain Conversion (n = 10^5) ===")
+    for name, value in benchmark_list_conversion(10**5).items():
+        print(f"  {name}: {value:.0f}" if name == "bytes/node" else f"  {name}: {value:.4f}s")
+
+    print("\n=== Approximate Dedupe (Bloom Filter) ===")
+    bloom = BloomFilter(expected_items=1000, error_rate=0.001)
+    head = remove_duplicates_approx(create_linked_list([1, 3, 2, 1, 4]), bloom)
+    print("After approximate dedupe:", end=" ")
+    print_list(head)  # 1 → 3 → 2 → 4
+    head = remove_duplicates_approx(create_linked_list([-1, -2, 5]), BloomFilter(1000, 0.001))
+    print("hash(-1) == hash(-2), both kept:", end=" ")
+    print_list(head)  # -1 → -2 → 5
+    stream = (random.randrange(50000) for _ in range(100000))
+    bloom = BloomFilter(expected_items=50000, error_rate=0.01)
+    kept = sum(1 for _ in dedupe_approx(stream, bloom))
+    print(f"Stream: kept {kept} distinct, {bloom.memory_bytes()} bytes, "
+          f"estimated FP rate {bloom.estimated_fp_rate():.4f}")
+
+    print("\n=== Brent's Cycle Detection ===")
+    head = create_linked_list([1, 2, 3, 4])
+    head.next.next.next.next = head.next  # 4 → 2
+    start, length = find_cycle_brent(head)
+    print("Cycle start:", start.val, "length:", length)  # 2 3
+    remap = {0: 1, 1: 2, 2: 3, 3: 1}
+    print("ID remap cycle (mu, lam, start):", brent_cycle(remap.get, 0))  # (1, 3, 1)
+    for mu, lam, floyd, brent, floyd_s, brent_s in benchmark_cycle_detection():
+        print(f"  mu={mu} lam={lam}: Floyd {floyd} steps {floyd_s:.3f}s, "
+              f"Brent {brent} steps {brent_s:.3f}s")
@@ -7,6 +7,11 @@ Focus on pointer manipulation and edge cases.
 After attempting, check solutions.py for answers and explanations.
 """
 
+import gc
+from collections import deque
+from contextlib import contextmanager
+from itertools import islice, repeat
+
 
 # ============================================================================
 # NODE DEFINITION
@@ -14,6 +19,8 @@ After attempting, check solutions.py for answers and explanations.
 
 
 class ListNode:
+    __slots__ = ("val", "next")
+
     def __init__(self, val=0, next=None):
         self.val = val
         self.next = next
@@ -24,36 +31,51 @@ class ListNode:
 # ============================================================================
 
 
+@contextmanager
+def gc_paused():
+    """Pause the cyclic GC while allocating many nodes."""
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
 def create_linked_list(arr):
-    """Create linked list from array."""
-    if not arr:
-        return None
-    head = ListNode(arr[0])
-    current = head
-    for i in range(1, len(arr)):
-        current.next = ListNode(arr[i])
-        current = current.next
-    return head
+    """Create linked list from array (bulk build, links nodes via map)."""
+    with gc_paused():
+        nodes = list(map(ListNode, arr))
+        if not nodes:
+            return None
+        # nodes[i].next = nodes[i + 1], drained by a zero-length deque
+        deque(map(setattr, nodes, repeat("next"), islice(nodes, 1, None)), maxlen=0)
+    return nodes[0]
+
+
+def iter_list_nodes(head):
+    """Lazy view over the nodes of a linked list."""
+    while head:
+        yield head
+        head = head.next
+
+
+def iter_list_values(head):
+    """Lazy view over the values of a linked list."""
+    while head:
+        yield head.val
+        head = head.next
 
 
 def print_list(head):
     """Print linked list."""
-    values = []
-    current = head
-    while current:
-        values.append(str(current.val))
-        current = current.next
-    print(" → ".join(values) + " → None")
+    print(" → ".join(map(str, iter_list_values(head))) + " → None")
 
 
 def list_to_array(head):
     """Convert linked list to array for testing."""
-    result = []
-    current = head
-    while current:
-        result.append(current.val)
-        current = current.next
-    return result
+    return list(iter_list_values(head))
 
 
 # ============================================================================
@@ -8,41 +8,71 @@ Study the approach and complexity analysis for each problem.
 # See demonstrations.py for full implementations with detailed comments.
 # This file contains the same solutions with concise explanations.
 
+import gc
+import random
+import time
+import tracemalloc
+from array import array
+from collections import deque
+from contextlib import contextmanager
+from itertools import islice, repeat
+from math import isqrt
+
 
 class ListNode:
+    __slots__ = ("val", "next")
+
     def __init__(self, val=0, next=None):
         self.val = val
         self.next = next
 
 
 # Helper functions
+@contextmanager
+def gc_paused():
+    """Pause the cyclic GC while allocating many nodes"""
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
 def create_linked_list(arr):
-    if not arr:
-        return None
-    head = ListNode(arr[0])
-    current = head
-    for i in range(1, len(arr)):
-        current.next = ListNode(arr[i])
-        current = current.next
-    return head
+    """
+    Time: O(n), Space: O(n)
+    Approach: Bulk build - map() allocates and links nodes in C-level loops,
+    cyclic GC paused so fresh nodes don't trigger repeated collections
+    """
+    with gc_paused():
+        nodes = list(map(ListNode, arr))
+        if not nodes:
+            return None
+        # nodes[i].next = nodes[i + 1], drained by a zero-length deque
+        deque(map(setattr, nodes, repeat("next"), islice(nodes, 1, None)), maxlen=0)
+    return nodes[0]
+
+
+def iter_list_nodes(head):
+    while head:
+        yield head
+        head = head.next
+
+
+def iter_list_values(head):
+    while head:
+        yield head.val
+        head = head.next
 
 
 def print_list(head):
-    values = []
-    current = head
-    while current:
-        values.append(str(current.val))
-        current = current.next
-    print(" → ".join(values) + " → None")
+    print(" → ".join(map(str, iter_list_values(head))) + " → None")
 
 
 def list_to_array(head):
-    result = []
-    current = head
-    while current:
-        result.append(current.val)
-        current = current.next
-    return result
+    return list(iter_list_values(head))
 
 
 # ============================================================================
@@ -214,6 +244,114 @@ def sort_list(head):
     return merge_two_sorted_lists(left, right)
 
 
+def _take_run(head):
+    """
+    Cut the natural run starting at head; return (run_head, run_tail, rest).
+    Strictly descending runs are reversed in place (stays stable)
+    """
+    if head.next and head.next.val < head.val:
+        run_tail = head
+        prev = None
+        current = head
+        while True:
+            following = current.next
+            current.next = prev
+            prev = current
+            current = following
+            if not current or current.val >= prev.val:
+                return prev, run_tail, current
+
+    current = head
+    while current.next and current.next.val >= current.val:
+        current = current.next
+    rest = current.next
+    current.next = None
+    return head, current, rest
+
+
+def _merge_runs(l1, l2):
+    """Stable merge that also returns the merged tail"""
+    dummy = tail = ListNode(0)
+    while l1 and l2:
+        if l1.val <= l2.val:
+            tail.next = l1
+            l1 = l1.next
+        else:
+            tail.next = l2
+            l2 = l2.next
+        tail = tail.next
+
+    tail.next = l1 if l1 else l2
+    while tail.next:
+        tail = tail.next
+    return dummy.next, tail
+
+
+def sort_list_iterative(head):
+    """
+    Time: O(n log r) for r natural runs (O(n) if already sorted),
+    Space: O(1) - no recursion
+    Approach: Bottom-up natural merge sort (Timsort-style runs)
+    - Each pass cuts the list into maximal runs (descending runs reversed)
+      and merges adjacent pairs of runs
+    - Stop when a pass finds a single run
+    """
+    if not head or not head.next:
+        return head
+
+    dummy = ListNode(0, head)
+    while True:
+        tail = dummy
+        current = dummy.next
+        merges = 0
+
+        while current:
+            run1, run1_tail, current = _take_run(current)
+            if not current:
+                tail.next = run1
+                break
+
+            run2, _, current = _take_run(current)
+            merged, merged_tail = _merge_runs(run1, run2)
+            tail.next = merged
+            tail = merged_tail
+            merges += 1
+
+        if merges == 0:
+            return dummy.next
+
+
+def benchmark_recursion_free(sizes=(10**4, 10**5, 10**6, 10**7), k=3):
+    """
+    Time recursive vs iterative sort_list / reverse_k_group.
+
+    Returns: [(n, name, recursive_seconds_or_error, iterative_seconds)]
+    """
+    rows = []
+    for n in sizes:
+        values = [(i * 2654435761) % n for i in range(n)]
+        cases = [
+            ("sort_list", sort_list, sort_list_iterative, ()),
+            ("reverse_k_group", reverse_k_group, reverse_k_group_iterative, (k,)),
+        ]
+        for name, recursive_fn, iterative_fn, args in cases:
+            head = create_linked_list(values)
+            start = time.perf_counter()
+            try:
+                recursive_fn(head, *args)
+                recursive = time.perf_counter() - start
+            except RecursionError:
+                recursive = "RecursionError"
+
+            head = create_linked_list(values)
+            start = time.perf_counter()
+            iterative_fn(head, *args)
+            iterative = time.perf_counter() - start
+            rows.append((n, name, recursive, iterative))
+
+    return rows
+
+
 # ============================================================================
 # EXERCISE 4: Manipulation
 # ============================================================================
@@ -341,6 +479,37 @@ def reverse_k_group(head, k):
     return prev
 
 
+def reverse_k_group_iterative(head, k):
+    """
+    Time: O(n), Space: O(1) - no recursion, so no recursion limit
+    Approach: Dummy node; for each full group of k, reverse it in place
+    and splice it between the previous group's tail and the next group
+    """
+    dummy = ListNode(0, head)
+    group_prev = dummy
+
+    while True:
+        # Check if there are k nodes remaining
+        kth = group_prev
+        for _ in range(k):
+            kth = kth.next
+            if not kth:
+                return dummy.next
+
+        group_next = kth.next
+        prev, current = group_next, group_prev.next
+        while current is not group_next:
+            next_temp = current.next
+            current.next = prev
+            prev = current
+            current = next_temp
+
+        # Old group head is now the group tail
+        old_head = group_prev.next
+        group_prev.next = kth
+        group_prev = old_head
+
+
 # ============================================================================
 # EXERCISE 6: Advanced
 # ============================================================================
@@ -460,6 +629,578 @@ def rotate_right(head, k):
     return new_head
 
 
+# ============================================================================
+# EXERCISE 7: Design Problems
+# ============================================================================
+
+
+class _Block:
+    """Unrolled list node: up to B values in one compact array"""
+
+    __slots__ = ("values", "next")
+
+    def __init__(self, values, next=None):
+        self.values = values
+        self.next = next
+
+
+class MyLinkedList:
+    """
+    Time: O(log n) to locate + O(B) C-level array shift, B = O(√n)
+    Space: O(n)
+    Approach: Unrolled linked list with a cumulative-size skip index
+    - Each node (block) holds up to B = max(block_size, √n) values in an
+      array('q'), so there are O(√n) nodes
+    - blocks[] lists the nodes in order; a Fenwick tree over their sizes
+      finds the block holding any index in O(log n)
+    - Split a block that overflows B, merge one that drops below B / 4
+      into its successor. Only these rebuild the index, O(√n) each, and
+      a block needs Θ(B) = Θ(√n) edits between them (amortized O(1))
+    - With a fixed B the rebuild would be O(n / B) every B / 2 appends,
+      i.e. quadratic construction
+    """
+
+    def __init__(self, block_size=64):
+        self.block_size = block_size
+        self.blocks = []
+        self.tree = [0]  # Fenwick tree over block sizes, 1-based
+        self.size = 0
+
+    def _capacity(self):
+        """Block capacity B, grown with √n so blocks stay O(√n) in number"""
+        return max(self.block_size, isqrt(self.size))
+
+    def _rebuild_index(self):
+        """O(number of blocks) - after a split or merge"""
+        m = len(self.blocks)
+        tree = [0] * (m + 1)
+        for i, block in enumerate(self.blocks, 1):
+            tree[i] += len(block.values)
+            parent = i + (i & -i)
+            if parent <= m:
+                tree[parent] += tree[i]
+        self.tree = tree
+
+    def _update(self, b, delta):
+        """Adjust size of block b (0-based) in the index"""
+        i = b + 1
+        while i < len(self.tree):
+            self.tree[i] += delta
+            i += i & -i
+
+    def _locate(self, index):
+        """Return (block number, offset) holding index - O(log n)"""
+        pos = 0
+        step = 1 << (len(self.tree) - 1).bit_length()
+        while step:
+            nxt = pos + step
+            if nxt < len(self.tree) and self.tree[nxt] <= index:
+                pos = nxt
+                index -= self.tree[nxt]
+            step >>= 1
+        return pos, index
+
+    def get(self, index):
+        if index < 0 or index >= self.size:
+            return -1
+        b, offset = self._locate(index)
+        return self.blocks[b].values[offset]
+
+    def addAtHead(self, val):
+        self.addAtIndex(0, val)
+
+    def addAtTail(self, val):
+        self.addAtIndex(self.size, val)
+
+    def addAtIndex(self, index, val):
+        if index < 0 or index > self.size:
+            return
+
+        if not self.blocks:
+            self.blocks.append(_Block(array("q", [val])))
+            self._rebuild_index()
+            self.size = 1
+            return
+
+        if index == self.size:
+            b, offset = len(self.blocks) - 1, len(self.blocks[-1].values)
+        else:
+            b, offset = self._locate(index)
+
+        block = self.blocks[b]
+        block.values.insert(offset, val)
+        self.size += 1
+
+        if len(block.values) > self._capacity():
+            # Split: second half becomes a new node right after this one
+            half = len(block.values) // 2
+            new_block = _Block(block.values[half:], block.next)
+            del block.values[half:]
+            block.next = new_block
+            self.blocks.insert(b + 1, new_block)
+            self._rebuild_index()
+        else:
+            self._update(b, 1)
+
+    def deleteAtIndex(self, index):
+        if index < 0 or index >= self.size:
+            return
+
+        b, offset = self._locate(index)
+        block = self.blocks[b]
+        del block.values[offset]
+        self.size -= 1
+
+        following = block.next
+        capacity = self._capacity()
+        if not block.values:
+            # Unlink empty node
+            if b > 0:
+                self.blocks[b - 1].next = following
+            del self.blocks[b]
+            self._rebuild_index()
+        elif (
+            len(block.values) < capacity // 4
+            and following
+            and len(block.values) + len(following.values) <= capacity * 3 // 4
+        ):
+            # Merge underfull node with its successor
+            block.values.extend(following.values)
+            block.next = following.next
+            del self.blocks[b + 1]
+            self._rebuild_index()
+        else:
+            self._update(b, -1)
+
+    def __iter__(self):
+        block = self.blocks[0] if self.blocks else None
+        while block:
+            yield from block.values
+            block = block.next
+
+
+class ListNodeLinkedList:
+    """
+    Time: O(n) per indexed operation, Space: O(n)
+    Approach: Classic design with a dummy head and ListNode chain
+    (kept as the baseline for benchmark_my_linked_list)
+    """
+
+    def __init__(self):
+        self.dummy = ListNode(0)
+        self.size = 0
+
+    def _node_before(self, index):
+        node = self.dummy
+        for _ in range(index):
+            node = node.next
+        return node
+
+    def get(self, index):
+        if index < 0 or index >= self.size:
+            return -1
+        return self._node_before(index + 1).val
+
+    def addAtHead(self, val):
+        self.addAtIndex(0, val)
+
+    def addAtTail(self, val):
+        self.addAtIndex(self.size, val)
+
+    def addAtIndex(self, index, val):
+        if index < 0 or index > self.size:
+            return
+        prev = self._node_before(index)
+        prev.next = ListNode(val, prev.next)
+        self.size += 1
+
+    def deleteAtIndex(self, index):
+        if index < 0 or index >= self.size:
+            return
+        prev = self._node_before(index)
+        prev.next = prev.next.next
+        self.size -= 1
+
+
+def benchmark_my_linked_list(n=20000, ops=20000, seed=0):
+    """
+    Mixed workload (get / addAtIndex / deleteAtIndex at random positions)
+    on the unrolled MyLinkedList, the ListNode design and a Python list.
+
+    Returns: {name: seconds}
+    """
+    rng = random.Random(seed)
+    workload = [(rng.random(), rng.random(), rng.randint(0, 10**6)) for _ in range(ops)]
+    timings = {}
+
+    def run(add, get, delete, length):
+        for i in range(n):
+            add(length(), i)
+        for kind, where, val in workload:
+            size = length()
+            if kind < 0.5:
+                get(int(where * size))
+            elif kind < 0.75:
+                add(int(where * (size + 1)), val)
+            else:
+                delete(int(where * size))
+
+    for name, design in (("unrolled", MyLinkedList()), ("ListNode", ListNodeLinkedList())):
+        start = time.perf_counter()
+        run(design.addAtIndex, design.get, design.deleteAtIndex, lambda d=design: d.size)
+        timings[name] = time.perf_counter() - start
+
+    items = []
+
+    def delete(index):
+        if 0 <= index < len(items):
+            del items[index]
+
+    start = time.perf_counter()
+    run(items.insert, lambda i: items[i] if 0 <= i < len(items) else -1, delete, items.__len__)
+    timings["python list"] = time.perf_counter() - start
+
+    return timings
+
+
+def benchmark_my_linked_list_scaling(sizes=(10**5, 4 * 10**5, 16 * 10**5), seed=0):
+    """
+    Per-operation cost of MyLinkedList as n grows: build by addAtTail,
+    then n random addAtIndex / get / deleteAtIndex each.
+    Flat numbers across sizes mean no hidden O(n) work per operation
+    (a fixed block size made the build quadratic).
+
+    Returns: {n: {operation: microseconds per op}}
+    """
+    rng = random.Random(seed)
+    results = {}
+
+    for n in sizes:
+        my_list = MyLinkedList()
+        per_op = {}
+
+        start = time.perf_counter()
+        for i in range(n):
+            my_list.addAtTail(i)
+        per_op["addAtTail"] = (time.perf_counter() - start) / n * 1e6
+
+        for name, op in (
+            ("addAtIndex", lambda: my_list.addAtIndex(rng.randint(0, my_list.size), 0)),
+            ("get", lambda: my_list.get(rng.randrange(my_list.size))),
+            ("deleteAtIndex", lambda: my_list.deleteAtIndex(rng.randrange(my_list.size))),
+        ):
+            start = time.perf_counter()
+            for _ in range(n):
+                op()
+            per_op[name] = (time.perf_counter() - start) / n * 1e6
+
+        results[n] = per_op
+
+    return results
+
+
+# ============================================================================
+# ADVANCED: ARENA-BACKED LINKED LIST
+# ============================================================================
+
+NIL = -1
+
+
+class ListArena:
+    """
+    Linked lists stored in two parallel typed arrays instead of objects.
+
+    A node is an index i: its value is vals[i] and its successor is
+    nxt[i] (NIL = -1 ends a list). Freed slots form a free list threaded
+    through nxt, so deleted nodes are reused before the arrays grow.
+    Each node costs 16 bytes (two int64 slots) instead of a ~56+ byte
+    ListNode object, and building or sorting a list is a bulk array job.
+
+    Trade-off: in CPython each vals[i] / nxt[i] read creates an int
+    object, so step-by-step walks are no faster than following .next;
+    the wins are memory, allocation time and bulk operations.
+
+    Values must be integers (array typecode 'q').
+
+    Example: arena = ListArena()
+             head = arena.from_list([1, 2, 3])
+             arena.to_list(arena.reverse_list(head)) → [3, 2, 1]
+    """
+
+    def __init__(self):
+        self.vals = array("q")
+        self.nxt = array("q")
+        self.free = NIL
+
+    def alloc(self, val, next_idx=NIL):
+        """Time: O(1) amortized - reuse a freed slot if there is one"""
+        if self.free != NIL:
+            idx = self.free
+            self.free = self.nxt[idx]
+            self.vals[idx] = val
+            self.nxt[idx] = next_idx
+            return idx
+
+        self.vals.append(val)
+        self.nxt.append(next_idx)
+        return len(self.vals) - 1
+
+    def release(self, idx):
+        """Time: O(1) - push slot onto the free list"""
+        self.nxt[idx] = self.free
+        self.free = idx
+
+    def from_list(self, values):
+        """
+        Time: O(n), Space: O(n)
+        Bulk build: append all values, then link consecutive new slots
+        """
+        n = len(values)
+        if n == 0:
+            return NIL
+
+        start = len(self.vals)
+        self.vals.extend(values)
+        self.nxt.extend(range(start + 1, start + n + 1))
+        self.nxt[start + n - 1] = NIL
+        return start
+
+    def to_list(self, head):
+        """Time: O(n), Space: O(n)"""
+        vals, nxt = self.vals, self.nxt
+        result = []
+        while head != NIL:
+            result.append(vals[head])
+            head = nxt[head]
+        return result
+
+    def reverse_list(self, head):
+        """Time: O(n), Space: O(1) - same three pointers, on indices"""
+        nxt = self.nxt
+        prev = NIL
+        while head != NIL:
+            following = nxt[head]
+            nxt[head] = prev
+            prev = head
+            head = following
+        return prev
+
+    def find_middle(self, head):
+        """Time: O(n), Space: O(1) - returns index of (second) middle"""
+        nxt = self.nxt
+        slow = fast = head
+        while fast != NIL and nxt[fast] != NIL:
+            slow = nxt[slow]
+            fast = nxt[nxt[fast]]
+        return slow
+
+    def has_cycle(self, head):
+        """Time: O(n), Space: O(1) - Floyd's algorithm"""
+        nxt = self.nxt
+        slow = fast = head
+        while fast != NIL and nxt[fast] != NIL:
+            slow = nxt[slow]
+            fast = nxt[nxt[fast]]
+            if slow == fast:
+                return True
+        return False
+
+    def merge_two_sorted_lists(self, l1, l2):
+        """Time: O(n + m), Space: O(1) - relinks existing slots"""
+        vals, nxt = self.vals, self.nxt
+        if l1 == NIL or l2 == NIL:
+            return l1 if l1 != NIL else l2
+
+        # Ties take l1 first, so merging runs in order is stable
+        if vals[l2] < vals[l1]:
+            head = tail = l2
+            l2 = nxt[l2]
+        else:
+            head = tail = l1
+            l1 = nxt[l1]
+
+        while l1 != NIL and l2 != NIL:
+            if vals[l1] <= vals[l2]:
+                nxt[tail] = l1
+                tail, l1 = l1, nxt[l1]
+            else:
+                nxt[tail] = l2
+                tail, l2 = l2, nxt[l2]
+
+        nxt[tail] = l1 if l1 != NIL else l2
+        return head
+
+    def _take_run(self, head):
+        """
+        Cut the natural run at head; return (run_head, run_tail, rest).
+        Strictly descending runs are reversed in place (stays stable)
+        """
+        vals, nxt = self.vals, self.nxt
+        following = nxt[head]
+        if following != NIL and vals[following] < vals[head]:
+            prev, current = NIL, head
+            while True:
+                following = nxt[current]
+                nxt[current] = prev
+                prev, current = current, following
+                if current == NIL or vals[current] >= vals[prev]:
+                    return prev, head, current
+
+        current = head
+        while nxt[current] != NIL and vals[nxt[current]] >= vals[current]:
+            current = nxt[current]
+        rest = nxt[current]
+        nxt[current] = NIL
+        return head, current, rest
+
+    def sort_list(self, head):
+        """
+        Time: O(n log r) for r natural runs, Space: O(1) - relinks nxt only
+        Approach: Bottom-up natural merge sort, as in sort_list_iterative:
+        each pass cuts maximal runs and merges adjacent pairs with
+        merge_two_sorted_lists; stop when a pass finds a single run
+        """
+        nxt = self.nxt
+        while head != NIL:
+            new_head = tail = NIL
+            current = head
+            merges = 0
+
+            while current != NIL:
+                run, run_tail, current = self._take_run(current)
+                if current != NIL:
+                    other, other_tail, current = self._take_run(current)
+                    run = self.merge_two_sorted_lists(run, other)
+                    # The merged tail is whichever run tail ends up last
+                    run_tail = other_tail if nxt[other_tail] == NIL else run_tail
+                    merges += 1
+
+                if tail == NIL:
+                    new_head = run
+                else:
+                    nxt[tail] = run
+                tail = run_tail
+
+            head = new_head
+            if merges == 0:
+                break
+
+        return head
+
+    def partition(self, head, x):
+        """Time: O(n), Space: O(1) - two chains, no dummy nodes needed"""
+        vals, nxt = self.vals, self.nxt
+        before_head = before_tail = after_head = after_tail = NIL
+
+        while head != NIL:
+            following = nxt[head]
+            if vals[head] < x:
+                if before_tail == NIL:
+                    before_head = head
+                else:
+                    nxt[before_tail] = head
+                before_tail = head
+            else:
+                if after_tail == NIL:
+                    after_head = head
+                else:
+                    nxt[after_tail] = head
+                after_tail = head
+            head = following
+
+        if after_tail != NIL:
+            nxt[after_tail] = NIL
+        if before_tail == NIL:
+            return after_head
+        nxt[before_tail] = after_head
+        return before_head
+
+    def rotate_right(self, head, k):
+        """Time: O(n), Space: O(1) - make circular, break at new tail"""
+        nxt = self.nxt
+        if head == NIL or nxt[head] == NIL or k == 0:
+            return head
+
+        length = 1
+        tail = head
+        while nxt[tail] != NIL:
+            tail = nxt[tail]
+            length += 1
+
+        nxt[tail] = head
+        new_tail = head
+        for _ in range(length - k % length - 1):
+            new_tail = nxt[new_tail]
+
+        new_head = nxt[new_tail]
+        nxt[new_tail] = NIL
+        return new_head
+
+    def remove_elements(self, head, val):
+        """Time: O(n), Space: O(1) - removed slots go to the free list"""
+        vals, nxt = self.vals, self.nxt
+        while head != NIL and vals[head] == val:
+            following = nxt[head]
+            self.release(head)
+            head = following
+
+        current = head
+        while current != NIL and nxt[current] != NIL:
+            victim = nxt[current]
+            if vals[victim] == val:
+                nxt[current] = nxt[victim]
+                self.release(victim)
+            else:
+                current = victim
+        return head
+
+
+def benchmark_arena_vs_nodes(n=200000):
+    """
+    Compare memory and speed of ListArena with ListNode chains.
+
+    Returns: {operation: (listnode_result, arena_result)} where memory is
+             in bytes (tracemalloc peak) and times are in seconds
+    """
+    values = [(i * 7919) % n for i in range(n)]
+    results = {}
+
+    tracemalloc.start()
+    head = create_linked_list(values)
+    node_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    tracemalloc.start()
+    arena = ListArena()
+    arena_head = arena.from_list(values)
+    arena_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    results["memory"] = (node_bytes, arena_bytes)
+
+    cases = [
+        ("reverse_list", reverse_list, arena.reverse_list),
+        ("find_middle", find_middle, arena.find_middle),
+        ("has_cycle", has_cycle, arena.has_cycle),
+        ("sort_list", sort_list, arena.sort_list),
+    ]
+    for name, node_fn, arena_fn in cases:
+        start = time.perf_counter()
+        out = node_fn(head)
+        node_time = time.perf_counter() - start
+        if name in ("reverse_list", "sort_list"):
+            head = out
+
+        start = time.perf_counter()
+        out = arena_fn(arena_head)
+        arena_time = time.perf_counter() - start
+        if name in ("reverse_list", "sort_list"):
+            arena_head = out
+
+        results[name] = (node_time, arena_time)
+
+    return results
+
+
 # ============================================================================
 # TESTING
 # ============================================================================
@@ -499,3 +1240,40 @@ if __name__ == "__main__":
     result = add_two_numbers(l1, l2)
     print("342 + 465 =", end=" ")
     print_list(result)
+
+    print("\n=== Arena-Backed Linked List ===")
+    arena = ListArena()
+    head = arena.from_list([1, 4, 3, 2, 5, 2])
+    print("Partition x=3:", arena.to_list(arena.partition(head, 3)))
+    head = arena.from_list([5, 1, 4, 2, 3])
+    print("Sorted:", arena.to_list(arena.sort_list(head)))
+    head = arena.rotate_right(arena.from_list([1, 2, 3, 4, 5]), 2)
+    print("Rotated right by 2:", arena.to_list(head))
+    print("Middle value:", arena.vals[arena.find_middle(head)])
+    head = arena.remove_elements(head, 4)
+    print("Removed 4s:", arena.to_list(head), "free slot:", arena.free)
+    for name, (node, arena_result) in benchmark_arena_vs_nodes(50000).items():
+        unit = "bytes" if name == "memory" else "s"
+        print(f"  {name}: ListNode {node:.4g} {unit}, arena {arena_result:.4g} {unit}")
+
+    print("\n=== Recursion-Free Sort / Reverse K-Group ===")
+    head = sort_list_iterative(create_linked_list([4, 2, 1, 3, 9, 8, 7, 5]))
+    print("Natural merge sort:", list_to_array(head))
+    head = reverse_k_group_iterative(create_linked_list([1, 2, 3, 4, 5]), 2)
+    print("Reverse in groups of 2:", list_to_array(head))
+    for n, name, recursive, iterative in benchmark_recursion_free((10**4, 10**5)):
+        rec = recursive if isinstance(recursive, str) else f"{recursive:.3f}s"
+        print(f"  n={n} {name}: recursive {rec}, iterative {iterative:.3f}s")
+
+    print("\n=== Design Linked List (Unrolled) ===")
+    my_list = MyLinkedList(block_size=4)
+    my_list.addAtHead(1)
+    my_list.addAtTail(3)
+    my_list.addAtIndex(1, 2)
+    print("get(1):", my_list.get(1))  # 2
+    my_list.deleteAtIndex(1)
+    print("get(1):", my_list.get(1))  # 3
+    for name, seconds in benchmark_my_linked_list(3000, 3000).items():
+        print(f"  {name}: {seconds:.3f}s")
+    for n, per_op in benchmark_my_linked_list_scaling((10**4, 10**5)).items():
+        print(f"  n={n}: " + ", ".join(f"{op} {us:.1f}µs" for op, us in per_op.items()))
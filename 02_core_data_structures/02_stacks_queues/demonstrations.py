@@ -5,7 +5,17 @@ This file demonstrates common stack and queue patterns and operations.
 Study each function and its use case.
 """
 
+import asyncio
+import bisect
+import heapq
+import math
+import mmap
+import os
+import random
+import tempfile
+import time
 from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 
 # ============================================================================
 # BASIC STACK IMPLEMENTATION
@@ -214,6 +224,188 @@ def is_valid_parentheses_advanced(s):
     return len(stack) == 0
 
 
+BRACKET_PAIRS = {ord("("): ord(")"), ord("["): ord("]"), ord("{"): ord("}")}
+CLOSING_BRACKETS = frozenset(BRACKET_PAIRS.values())
+CLOSER_OF = bytes.maketrans(b"([{", b")]}")
+
+
+def bracket_summary(chunk):
+    """
+    Reduce a chunk of bytes to what it leaves unmatched.
+
+    Time: O(n)
+    Space: O(n) worst case, O(depth) typically
+
+    Returns: (ok, closers, openers)
+    - ok: False if a closer met the wrong opener (can never be fixed)
+    - closers: unmatched closing brackets, left to right
+    - openers: unmatched opening brackets, bottom to top of the stack
+
+    Non-bracket bytes are ignored, like is_valid_parentheses_advanced.
+
+    Example: b")](([" → (True, b")]", b"((["), b"(]" → (False, b"", b"")
+    """
+    stack = []
+    closers = []
+
+    for byte in chunk:
+        if byte in BRACKET_PAIRS:
+            stack.append(byte)
+        elif byte in CLOSING_BRACKETS:
+            if not stack:
+                closers.append(byte)
+            elif BRACKET_PAIRS[stack.pop()] != byte:
+                return False, b"", b""
+
+    return True, bytes(closers), bytes(stack)
+
+
+def combine_bracket_summaries(left, right):
+    """
+    Combine summaries of two adjacent chunks (associative).
+
+    The left chunk's open brackets (top first) meet the right chunk's
+    unmatched closers (first first); whatever survives on either side
+    becomes the combined summary.
+
+    Time: O(min(len(left openers), len(right closers)))
+    Space: O(result)
+
+    Example: combine((True, b"", b"(["), (True, b"])", b"{"))
+             → (True, b"", b"{")
+    """
+    left_ok, left_closers, left_openers = left
+    right_ok, right_closers, right_openers = right
+    if not (left_ok and right_ok):
+        return False, b"", b""
+
+    matched = min(len(left_openers), len(right_closers))
+    for i in range(matched):
+        if BRACKET_PAIRS[left_openers[-1 - i]] != right_closers[i]:
+            return False, b"", b""
+
+    if len(left_openers) > matched:
+        # Right closers all matched; left's remaining openers sit below right's
+        openers = left_openers[: len(left_openers) - matched] + right_openers
+        return True, left_closers, openers
+
+    return True, left_closers + right_closers[matched:], right_openers
+
+
+def fold_bracket_summary(openers, summary):
+    """
+    Fold the next chunk's summary into the carried openers, in place.
+
+    openers is a bytearray (bottom to top). Only the matched tail is
+    deleted and the chunk's own openers appended, so no step copies the
+    whole carried stack.
+
+    Time: O(matched + new openers) - O(n) over a whole document
+    Space: O(1) beyond the stack itself
+
+    Returns: False once the input can no longer be valid (a mismatch or a
+    closer with nothing left to match)
+    """
+    ok, closers, right_openers = summary
+    if not ok or len(closers) > len(openers):
+        return False
+
+    matched = len(closers)
+    if matched:
+        # Top openers, top first, must close in the order they appear
+        if openers[-matched:][::-1].translate(CLOSER_OF) != closers:
+            return False
+        del openers[-matched:]
+
+    openers += right_openers
+    return True
+
+
+def is_valid_parentheses_stream(chunks):
+    """
+    Validate brackets over an iterable of str/bytes chunks (e.g. a file).
+
+    Time: O(n)
+    Space: O(chunk + depth) - only the unmatched openers are carried over
+
+    Approach: Fold chunk summaries left to right into one bytearray of
+    openers (fold_bracket_summary). Stop early on a mismatch or an
+    unmatched closer, since neither can be repaired.
+
+    Example: is_valid_parentheses_stream(["([", "]{", "})"]) → True
+    """
+    openers = bytearray()
+
+    for chunk in chunks:
+        if isinstance(chunk, str):
+            chunk = chunk.encode()
+        if not fold_bracket_summary(openers, bracket_summary(chunk)):
+            return False
+
+    return not openers
+
+
+def iter_file_chunks(path, chunk_size=1 << 20):
+    """
+    Yield a file's contents as bytes chunks of chunk_size.
+
+    Time: O(n)
+    Space: O(chunk_size)
+    """
+    with open(path, "rb") as f:
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                return
+            yield chunk
+
+
+def _bracket_summary_of_range(args):
+    """Worker: summarize bytes [start, stop) of a memory-mapped file."""
+    path, start, stop = args
+    with open(path, "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return bracket_summary(mm[start:stop])
+
+
+def is_valid_parentheses_parallel(path, workers=None, chunk_size=1 << 24):
+    """
+    Validate brackets in a large file using several processes.
+
+    Time: O(n / workers) per process + O(chunks * depth) to combine
+    Space: O(chunk_size) per process plus the summaries
+
+    Approach:
+    - Split the file into byte ranges (brackets are single ASCII bytes)
+    - Each process memory-maps the file and summarizes its range
+    - Summaries are folded in order into one bytearray of openers
+      (fold_bracket_summary), so the carried stack is never copied
+
+    Example: is_valid_parentheses_parallel("doc.txt", workers=8)
+    """
+    size = os.path.getsize(path)
+    if size == 0:
+        return True
+
+    ranges = [
+        (path, start, min(start + chunk_size, size))
+        for start in range(0, size, chunk_size)
+    ]
+
+    def fold(summaries):
+        openers = bytearray()
+        for summary in summaries:
+            if not fold_bracket_summary(openers, summary):
+                return False
+        return not openers
+
+    if workers == 1 or len(ranges) == 1:
+        return fold(map(_bracket_summary_of_range, ranges))
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return fold(pool.map(_bracket_summary_of_range, ranges))
+
+
 # ============================================================================
 # PATTERN 2: MONOTONIC STACK
 # ============================================================================
@@ -312,6 +504,147 @@ def daily_temperatures(temps):
     return result
 
 
+def _next_greater_chunk(args):
+    """
+    Worker: resolve next-greater answers inside one chunk.
+
+    Returns: (local answers, pending stack, prefix-max records)
+    - answers use the default (-1 or 0) where the chunk couldn't decide
+    - pending: [(global index, value)] still waiting, values non-increasing
+    - records: [(global index, value)] strictly increasing running maxima
+    """
+    values, offset, as_distance = args
+    answers = [0 if as_distance else -1] * len(values)
+    stack = []
+    records = []
+
+    for i, val in enumerate(values):
+        while stack and values[stack[-1]] < val:
+            prev = stack.pop()
+            answers[prev] = i - prev if as_distance else val
+
+        if not records or val > records[-1][1]:
+            records.append((offset + i, val))
+
+        stack.append(i)
+
+    pending = [(offset + i, values[i]) for i in stack]
+    return answers, pending, records
+
+
+def _next_greater_parallel(nums, workers, chunk_size, as_distance):
+    """Shared driver for the chunk-parallel monotonic stack."""
+    n = len(nums)
+    if n == 0:
+        return []
+
+    workers = workers or os.cpu_count() or 1
+    chunk_size = chunk_size or -(-n // workers)
+    tasks = [
+        (nums[start : start + chunk_size], start, as_distance)
+        for start in range(0, n, chunk_size)
+    ]
+
+    if workers == 1 or len(tasks) == 1:
+        chunks = map(_next_greater_chunk, tasks)
+        return _merge_next_greater_chunks(chunks, as_distance)
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        chunks = pool.map(_next_greater_chunk, tasks)
+        return _merge_next_greater_chunks(chunks, as_distance)
+
+
+def _merge_next_greater_chunks(chunks, as_distance):
+    """
+    Merge phase: resolve indices left pending across chunk boundaries.
+
+    The global pending stack has non-increasing values (smallest on top)
+    and each chunk's records are increasing, so a two-pointer walk finds
+    the first greater element in the chunk for every resolvable index.
+    Whatever is left is >= everything in the chunk, so appending the
+    chunk's own pending stack keeps the global stack monotonic.
+    """
+    result = []
+    pending = []
+
+    for answers, chunk_pending, records in chunks:
+        result.extend(answers)
+
+        r = 0
+        while pending:
+            idx, val = pending[-1]
+            while r < len(records) and records[r][1] <= val:
+                r += 1
+            if r == len(records):
+                break
+
+            pending.pop()
+            next_idx, next_val = records[r]
+            result[idx] = next_idx - idx if as_distance else next_val
+
+        pending.extend(chunk_pending)
+
+    return result
+
+
+def next_greater_element_parallel(nums, workers=None, chunk_size=None):
+    """
+    Chunk-parallel next_greater_element for very long arrays.
+
+    Time: O(n / workers) per process + O(n) merge in the worst case
+    Space: O(n)
+
+    Approach:
+    1. Each process runs a left-to-right monotonic stack on its chunk,
+       answering every index whose next greater element is in the chunk
+    2. It exports the unresolved stack plus the chunk's running maxima
+    3. The merge phase walks chunks in order and resolves pending
+       indices against later chunks' running maxima
+
+    Example: next_greater_element_parallel([1, 5, 0, 3, 4, 5], chunk_size=2)
+    Output: [5, -1, 3, 4, 5, -1] (same as next_greater_element)
+    """
+    return _next_greater_parallel(nums, workers, chunk_size, as_distance=False)
+
+
+def daily_temperatures_parallel(temps, workers=None, chunk_size=None):
+    """
+    Chunk-parallel daily_temperatures for very long series.
+
+    Time: O(n / workers) per process + O(n) merge in the worst case
+    Space: O(n)
+
+    Same chunk/merge scheme as next_greater_element_parallel, but each
+    answer is the distance to the warmer day instead of its value.
+
+    Example: daily_temperatures_parallel([73,74,75,71,69,72,76,73], chunk_size=3)
+    Output: [1, 1, 4, 2, 1, 1, 0, 0] (same as daily_temperatures)
+    """
+    return _next_greater_parallel(temps, workers, chunk_size, as_distance=True)
+
+
+def benchmark_parallel_monotonic(n, process_counts=(1, 2, 4, 8, 16), seed=0):
+    """
+    Time serial vs chunk-parallel daily_temperatures on n random values.
+
+    Returns: {label: seconds}, after checking every result is identical
+    """
+    rng = random.Random(seed)
+    temps = [rng.randint(30, 100) for _ in range(n)]
+
+    start = time.perf_counter()
+    expected = daily_temperatures(temps)
+    timings = {"serial": time.perf_counter() - start}
+
+    for workers in process_counts:
+        start = time.perf_counter()
+        result = daily_temperatures_parallel(temps, workers=workers)
+        timings[f"{workers} proc"] = time.perf_counter() - start
+        assert result == expected, f"mismatch with {workers} processes"
+
+    return timings
+
+
 def trapping_rain_water(height):
     """
     Calculate water trapped after raining on elevation map.
@@ -366,31 +699,97 @@ def largest_rectangle_in_histogram(heights):
     Output: 10
     Explanation: Rectangle with height 5 and width 2 (indices 2-3)
     """
-    stack = []
-    max_area = 0
+    # Shares the stack kernel with largest_rectangle_with_bounds
+    return largest_rectangle_with_bounds(heights)[0]
 
-    for i in range(len(heights)):
-        while stack and heights[stack[-1]] > heights[i]:
-            h_idx = stack.pop()
-            h = heights[h_idx]
 
-            # Width is distance to current position
-            width = i if not stack else i - stack[-1] - 1
+def largest_rectangle_with_bounds(heights):
+    """
+    largest_rectangle_in_histogram that also reports where the rectangle is.
+
+    Time: O(n)
+    Space: O(n)
+
+    Same monotonic increasing stack; when a bar is popped, the rectangle
+    it bounds spans from just after the new stack top to just before i.
+
+    Returns: (area, left, right, height) with left/right inclusive,
+             or (0, -1, -1, 0) when there is no positive area
+
+    Example: [2,1,5,6,2,3]
+    Output: (10, 2, 3, 5)
+    """
+    stack = []
+    best = (0, -1, -1, 0)
+    n = len(heights)
 
-            area = h * width
-            max_area = max(max_area, area)
+    for i in range(n + 1):
+        # Sentinel height 0 at i == n flushes the remaining bars
+        current = heights[i] if i < n else 0
+
+        while stack and heights[stack[-1]] > current:
+            h = heights[stack.pop()]
+            left = stack[-1] + 1 if stack else 0
+            area = h * (i - left)
+            if area > best[0]:
+                best = (area, left, i - 1, h)
 
         stack.append(i)
 
-    # Process remaining bars
-    while stack:
-        h_idx = stack.pop()
-        h = heights[h_idx]
-        width = len(heights) if not stack else len(heights) - stack[-1] - 1
-        area = h * width
-        max_area = max(max_area, area)
+    return best
+
+
+def maximal_rectangle(grid, target=1, packed_width=None):
+    """
+    Largest all-`target` rectangle in a binary matrix, with coordinates.
+
+    Time: O(rows * cols)
+    Space: O(cols)
+
+    Approach: Treat each row as the base of a histogram.
+    - heights[c] = number of consecutive target cells ending at this row
+    - Update heights for a whole row at once with NumPy:
+      add 1 everywhere, then reset to 0 where the cell isn't target
+    - Run largest_rectangle_with_bounds on every row's histogram
+
+    Use target=0 to find the largest empty region of an occupancy grid.
+    For bit-packed input (np.packbits rows, e.g. a memory-mapped file),
+    pass packed_width = number of columns; rows are unpacked one at a time.
+
+    Note: requires numpy.
+
+    Returns: (area, (top, left, bottom, right)) inclusive, or (0, None)
+
+    Example: [[1,0,1,0,0],
+              [1,0,1,1,1],
+              [1,1,1,1,1],
+              [1,0,0,1,0]]
+    Output: (6, (1, 2, 2, 4))
+    """
+    import numpy as np
+
+    rows = len(grid)
+    if rows == 0:
+        return 0, None
+
+    cols = packed_width if packed_width is not None else len(grid[0])
+    heights = np.zeros(cols, dtype=np.int64)
+    best_area, best_rect = 0, None
 
-    return max_area
+    for r in range(rows):
+        if packed_width is not None:
+            row = np.unpackbits(np.asarray(grid[r], dtype=np.uint8), count=cols)
+        else:
+            row = np.asarray(grid[r])
+
+        heights += 1
+        heights[row != target] = 0
+
+        area, left, right, h = largest_rectangle_with_bounds(heights.tolist())
+        if area > best_area:
+            best_area, best_rect = area, (r - h + 1, left, r, right)
+
+    return best_area, best_rect
 
 
 # ============================================================================
@@ -603,6 +1002,208 @@ def first_negative_in_window(nums, k):
     return result
 
 
+class SlidingWindowQuantile:
+    """
+    Rolling median / any percentile over the last k values.
+
+    Re-sorting every window costs O(k log k) per step. Instead keep the
+    window in a bucketed sorted list:
+    - buckets: sorted Python lists of about L = max(32, sqrt(k)) values
+    - maxes[b]: largest value of bucket b, bisected to find a value's bucket
+    - tree: Fenwick tree over bucket sizes, so the value of any rank (and
+      therefore any quantile) is found in O(log k)
+
+    One window answers every quantile: p50, p95 and p99 of the same
+    latency window are three O(log k) queries, not three structures.
+
+    Buckets split above 2L values and merge with a neighbour below L / 2.
+    Only those events rebuild the Fenwick tree (O(k / L)), and each needs
+    Θ(L) updates first, so rebuilds cost amortized O(1).
+
+    Time: O(log k) per add and per quantile query, plus an O(L) C-level
+          list shift inside one bucket
+    Space: O(k)
+
+    Example: w = SlidingWindowQuantile(3)
+             add 1, 3, -1 → value() = 1
+             add -3       → window [3,-1,-3], value() = -1
+             w.quantile(0.95), w.quantile(0.99) on the same window
+    """
+
+    def __init__(self, k, q=0.5):
+        if k <= 0 or not 0 < q <= 1:
+            raise ValueError("need k > 0 and 0 < q <= 1")
+
+        self.k = k
+        self.q = q  # Default quantile for value()
+        self.load = max(32, math.isqrt(k))
+        self.window = deque()
+        self.buckets = []
+        self.maxes = []
+        self.tree = [0]  # 1-based Fenwick tree over bucket sizes
+
+    def __len__(self):
+        return len(self.window)
+
+    def _rebuild(self):
+        """Recompute the Fenwick tree after buckets were split or merged."""
+        m = len(self.buckets)
+        tree = [0] * (m + 1)
+        for i, bucket in enumerate(self.buckets, 1):
+            tree[i] += len(bucket)
+            parent = i + (i & -i)
+            if parent <= m:
+                tree[parent] += tree[i]
+        self.tree = tree
+
+    def _update(self, b, delta):
+        i = b + 1
+        while i < len(self.tree):
+            self.tree[i] += delta
+            i += i & -i
+
+    def _insert(self, value):
+        if not self.buckets:
+            self.buckets.append([value])
+            self.maxes.append(value)
+            self._rebuild()
+            return
+
+        b = min(bisect.bisect_left(self.maxes, value), len(self.buckets) - 1)
+        bucket = self.buckets[b]
+        bisect.insort(bucket, value)
+        self.maxes[b] = bucket[-1]
+
+        if len(bucket) > 2 * self.load:
+            self.buckets.insert(b + 1, bucket[self.load :])
+            del bucket[self.load :]
+            self.maxes.insert(b, bucket[-1])
+            self._rebuild()
+        else:
+            self._update(b, 1)
+
+    def _remove(self, value):
+        b = bisect.bisect_left(self.maxes, value)
+        bucket = self.buckets[b]
+        del bucket[bisect.bisect_left(bucket, value)]
+
+        if not bucket:
+            del self.buckets[b], self.maxes[b]
+            self._rebuild()
+        elif len(bucket) < self.load // 2 and len(self.buckets) > 1:
+            # Merge with a neighbour; re-split if that overflows
+            if b + 1 == len(self.buckets):
+                b -= 1
+            merged = self.buckets[b] + self.buckets[b + 1]
+            if len(merged) > 2 * self.load:
+                half = len(merged) // 2
+                self.buckets[b : b + 2] = [merged[:half], merged[half:]]
+                self.maxes[b : b + 2] = [merged[half - 1], merged[-1]]
+            else:
+                self.buckets[b : b + 2] = [merged]
+                self.maxes[b : b + 2] = [merged[-1]]
+            self._rebuild()
+        else:
+            self.maxes[b] = bucket[-1]
+            self._update(b, -1)
+
+    def _select(self, rank):
+        """Value with 0-based rank in the sorted window."""
+        pos = 0
+        step = 1 << (len(self.tree) - 1).bit_length()
+        while step:
+            nxt = pos + step
+            if nxt < len(self.tree) and self.tree[nxt] <= rank:
+                pos = nxt
+                rank -= self.tree[nxt]
+            step >>= 1
+        return self.buckets[pos][rank]
+
+    def add(self, value):
+        """
+        Slide the window by one value.
+
+        Time: O(log k) amortized
+        Space: O(1) amortized
+        """
+        self.window.append(value)
+        self._insert(value)
+        if len(self.window) > self.k:
+            self._remove(self.window.popleft())
+
+    def quantile(self, q=None):
+        """
+        Return the q-quantile (nearest rank) of the current window.
+
+        Time: O(log k)
+        Space: O(1)
+        """
+        q = self.q if q is None else q
+        if not 0 < q <= 1:
+            raise ValueError("need 0 < q <= 1")
+        if not self.window:
+            return None
+        return self._select(max(1, math.ceil(q * len(self.window))) - 1)
+
+    def value(self):
+        """Return the default q-quantile given at construction."""
+        return self.quantile()
+
+    def median(self):
+        """
+        Return the window median, averaging the middle pair for even sizes.
+
+        Time: O(log k)
+        Space: O(1)
+        """
+        n = len(self.window)
+        if not n:
+            return None
+        if n % 2:
+            return self._select(n // 2)
+        return (self._select(n // 2 - 1) + self._select(n // 2)) / 2
+
+
+def sliding_window_quantile_stream(stream, k, q=0.5):
+    """
+    Yield the q-quantile of every complete window of size k.
+
+    Pass a tuple of quantiles, e.g. q=(0.5, 0.95, 0.99), to get a tuple of
+    them per window from one shared window.
+
+    Time: O(log k) amortized per element and quantile
+    Space: O(k)
+
+    Example: stream=iter([1,3,-1,-3,5,3,6,7]), k=3
+    Yields: 1, -1, -1, 3, 5, 6
+    """
+    many = isinstance(q, (tuple, list))
+    tracker = SlidingWindowQuantile(k)
+    for i, num in enumerate(stream):
+        tracker.add(num)
+        if i >= k - 1:
+            yield tuple(map(tracker.quantile, q)) if many else tracker.quantile(q)
+
+
+def sliding_window_median(nums, k):
+    """
+    Median of every sliding window of size k.
+
+    Time: O(n log k)
+    Space: O(k)
+
+    Example: nums=[1,3,-1,-3,5,3,6,7], k=3
+    Output: [1, -1, -1, 3, 5, 6]
+    """
+    tracker = SlidingWindowQuantile(k)
+    result = []
+    for i, num in enumerate(nums):
+        tracker.add(num)
+        if i >= k - 1:
+            result.append(tracker.median())
+    return result
+
+
 class RecentCounter:
     """
     Count requests within recent time window using deque.
@@ -641,6 +1242,142 @@ class RecentCounter:
         return len(self.requests)
 
 
+class BucketedRecentCounter:
+    """
+    Approximate RecentCounter with fixed memory, independent of traffic.
+
+    The window is split into `buckets` sub-windows of equal width kept in
+    a ring array. Each slot stores a request count and the epoch
+    (t // width) it belongs to, so stale slots are detected and reused.
+    Precision is one bucket: the window slides in steps of `width` ms.
+
+    Time: O(1) amortized per ping/count
+    Space: O(buckets) - no per-request storage
+
+    Example: BucketedRecentCounter(window=3000, buckets=3001) uses 1 ms
+             buckets and matches RecentCounter exactly for integer
+             timestamps; buckets=30 gives ~100 ms precision with 30 slots.
+    """
+
+    def __init__(self, window=3000, buckets=30):
+        """
+        Initialize counter.
+
+        Time: O(buckets)
+        Space: O(buckets)
+        """
+        if window <= 0 or buckets <= 0:
+            raise ValueError("window and buckets must be positive")
+
+        self.buckets = buckets
+        self.width = max(1, -(-(window + 1) // buckets))  # ceil division
+        self.counts = [0] * buckets
+        self.epochs = [-1] * buckets
+        self.total = 0
+        self.current_epoch = None
+
+    def _advance(self, epoch):
+        """Clear slots that fell out of the window when time moves forward."""
+        if self.current_epoch is None:
+            self.current_epoch = epoch - self.buckets
+
+        # Only the slots between the old and new epoch can have expired
+        start = max(self.current_epoch + 1, epoch - self.buckets + 1)
+        for e in range(start, epoch + 1):
+            slot = e % self.buckets
+            self.total -= self.counts[slot]
+            self.counts[slot] = 0
+            self.epochs[slot] = e
+
+        self.current_epoch = max(self.current_epoch, epoch)
+
+    def ping(self, t):
+        """
+        Record request at time t and return approximate count in the window.
+
+        Time: O(1) amortized
+        Space: O(1)
+        """
+        epoch = int(t // self.width)  # Float clocks (e.g. ms as float) too
+        self._advance(epoch)
+
+        slot = epoch % self.buckets
+        if self.epochs[slot] == epoch:
+            self.counts[slot] += 1
+            self.total += 1
+
+        return self.total
+
+    def count(self, t):
+        """
+        Return approximate number of requests in the window ending at t.
+
+        Time: O(1) amortized
+        Space: O(1)
+        """
+        self._advance(int(t // self.width))
+        return self.total
+
+
+class KeyedRateCounter:
+    """
+    Map of many BucketedRecentCounters, one per key (user, IP, endpoint).
+
+    Counters are created lazily and can be pruned once they go idle, so
+    memory is O(active keys * buckets).
+
+    Example: limiter.ping("alice", 10) → 1
+             limiter.ping("bob", 12) → 1
+             limiter.ping("alice", 20) → 2
+    """
+
+    def __init__(self, window=3000, buckets=30):
+        """
+        Initialize keyed counter.
+
+        Time: O(1)
+        Space: O(1)
+        """
+        self.window = window
+        self.buckets = buckets
+        self.counters = {}
+
+    def ping(self, key, t):
+        """
+        Record request for key at time t and return its window count.
+
+        Time: O(1) amortized
+        Space: O(buckets) for a new key
+        """
+        counter = self.counters.get(key)
+        if counter is None:
+            counter = BucketedRecentCounter(self.window, self.buckets)
+            self.counters[key] = counter
+        return counter.ping(t)
+
+    def count(self, key, t):
+        """
+        Return window count for key at time t (0 for unknown keys).
+
+        Time: O(1) amortized
+        Space: O(1)
+        """
+        counter = self.counters.get(key)
+        return counter.count(t) if counter else 0
+
+    def prune(self, t):
+        """
+        Drop counters with no requests in the window ending at t.
+
+        Time: O(k) where k is number of keys
+        Space: O(1)
+        """
+        idle = [key for key, c in self.counters.items() if c.count(t) == 0]
+        for key in idle:
+            del self.counters[key]
+        return len(idle)
+
+
 def max_consecutive_ones_iii(nums, k):
     """
     Maximum consecutive 1's after flipping at most k 0's.
@@ -674,6 +1411,95 @@ def max_consecutive_ones_iii(nums, k):
     return max_length
 
 
+def sliding_window_maximum_stream(stream, k):
+    """
+    Generator version of sliding_window_maximum for unbounded streams.
+
+    Time: O(1) amortized per element
+    Space: O(k) - deque holds at most k (index, value) pairs
+
+    Approach: Same monotonic deque, but store (index, value) pairs so the
+    input never has to be kept around. Yield each window maximum as soon
+    as the window is complete.
+
+    Example: stream=iter([1,3,1,2,0,5]), k=3
+    Yields: 3, 3, 2, 5
+    """
+    if k <= 0:
+        return
+
+    dq = deque()  # (index, value) pairs, values decreasing
+
+    for i, num in enumerate(stream):
+        # Remove elements outside current window
+        if dq and dq[0][0] <= i - k:
+            dq.popleft()
+
+        # Remove elements smaller than current (monotonic decreasing)
+        while dq and dq[-1][1] < num:
+            dq.pop()
+
+        dq.append((i, num))
+
+        if i >= k - 1:
+            yield dq[0][1]
+
+
+def first_negative_in_window_stream(stream, k):
+    """
+    Generator version of first_negative_in_window for unbounded streams.
+
+    Time: O(1) amortized per element
+    Space: O(k) - deque holds negatives of the current window only
+
+    Example: stream=iter([12,-1,-7,8]), k=2
+    Yields: -1, -7, -7
+    """
+    if k <= 0:
+        return
+
+    dq = deque()  # (index, value) pairs of negatives
+
+    for i, num in enumerate(stream):
+        # Remove negatives outside current window
+        if dq and dq[0][0] <= i - k:
+            dq.popleft()
+
+        if num < 0:
+            dq.append((i, num))
+
+        if i >= k - 1:
+            yield dq[0][1] if dq else 0
+
+
+def max_consecutive_ones_iii_stream(stream, k):
+    """
+    Generator version of max_consecutive_ones_iii for unbounded streams.
+
+    Yields the best window length seen so far after every element, so the
+    last value yielded equals max_consecutive_ones_iii(nums, k).
+
+    Time: O(1) per element
+    Space: O(k) - deque holds positions of at most k + 1 zeros
+
+    Example: stream=iter([1,1,0,0,1]), k=1
+    Yields: 1, 2, 3, 3, 3
+    """
+    zeros_pos = deque()
+    left = 0
+    max_length = 0
+
+    for right, num in enumerate(stream):
+        if num == 0:
+            zeros_pos.append(right)
+
+        if len(zeros_pos) > k:
+            left = zeros_pos.popleft() + 1
+
+        max_length = max(max_length, right - left + 1)
+        yield max_length
+
+
 # ============================================================================
 # PATTERN 5: BFS WITH QUEUE
 # ============================================================================
@@ -851,6 +1677,447 @@ def shortest_path_grid(grid):
     return -1  # No path found
 
 
+# ============================================================================
+# PATTERN 6: PRIORITY QUEUE
+# ============================================================================
+
+
+class IndexedDaryHeap:
+    """
+    Min-priority queue keyed by item, with decrease-key and remove.
+
+    heapq has no decrease-key, so schedulers push duplicate entries and
+    skip stale ones later. An indexed heap instead remembers where every
+    item sits, so its priority can be changed in place.
+
+    Storage: parallel arrays items[i] / priorities[i] plus a dict
+    position[item] = i. Node i has children d*i+1 .. d*i+d and parent
+    (i-1)//d. Larger d means a shallower tree: cheaper push and
+    decrease_key, slightly more comparisons per pop.
+
+    Time: push/decrease_key O(log_d n), pop/remove O(d log_d n),
+          peek/contains O(1)
+    Space: O(n)
+
+    Example: pq = IndexedDaryHeap(d=4)
+             pq.push("a", 5); pq.push("b", 3); pq.decrease_key("a", 1)
+             pq.pop() → ("a", 1)
+    """
+
+    def __init__(self, d=4):
+        if d < 2:
+            raise ValueError("arity must be at least 2")
+
+        self.d = d
+        self.items = []
+        self.priorities = []
+        self.position = {}
+
+    def __len__(self):
+        return len(self.items)
+
+    def __contains__(self, item):
+        return item in self.position
+
+    def _swap(self, i, j):
+        """Swap two slots and keep the position index in sync."""
+        items, priorities = self.items, self.priorities
+        items[i], items[j] = items[j], items[i]
+        priorities[i], priorities[j] = priorities[j], priorities[i]
+        self.position[items[i]] = i
+        self.position[items[j]] = j
+
+    def _sift_up(self, i):
+        """Move slot i up while it is smaller than its parent."""
+        priorities = self.priorities
+        while i > 0:
+            parent = (i - 1) // self.d
+            if priorities[i] >= priorities[parent]:
+                break
+            self._swap(i, parent)
+            i = parent
+
+    def _sift_down(self, i):
+        """Move slot i down while some child is smaller."""
+        priorities = self.priorities
+        n = len(priorities)
+        while True:
+            first = self.d * i + 1
+            if first >= n:
+                break
+
+            # Smallest of up to d children
+            smallest = first
+            for child in range(first + 1, min(first + self.d, n)):
+                if priorities[child] < priorities[smallest]:
+                    smallest = child
+
+            if priorities[smallest] >= priorities[i]:
+                break
+            self._swap(i, smallest)
+            i = smallest
+
+    def push(self, item, priority):
+        """
+        Add a new item.
+
+        Time: O(log_d n)
+        Space: O(1)
+        """
+        if item in self.position:
+            raise KeyError(f"{item!r} is already in the heap")
+
+        self.position[item] = len(self.items)
+        self.items.append(item)
+        self.priorities.append(priority)
+        self._sift_up(len(self.items) - 1)
+
+    def peek(self):
+        """
+        Return (item, priority) with the smallest priority, or None.
+
+        Time: O(1)
+        Space: O(1)
+        """
+        if not self.items:
+            return None
+        return self.items[0], self.priorities[0]
+
+    def _remove_at(self, i):
+        """Remove slot i by swapping in the last slot and re-sifting."""
+        last = len(self.items) - 1
+        if i != last:
+            self._swap(i, last)
+
+        item = self.items.pop()
+        priority = self.priorities.pop()
+        del self.position[item]
+
+        if i < len(self.items):
+            self._sift_down(i)
+            self._sift_up(i)
+
+        return item, priority
+
+    def pop(self):
+        """
+        Remove and return (item, priority) with the smallest priority.
+
+        Time: O(d log_d n)
+        Space: O(1)
+        """
+        if not self.items:
+            raise IndexError("pop from empty heap")
+        return self._remove_at(0)
+
+    def decrease_key(self, item, priority):
+        """
+        Lower an item's priority in place.
+
+        Time: O(log_d n)
+        Space: O(1)
+        """
+        i = self.position[item]
+        if priority > self.priorities[i]:
+            raise ValueError("new priority is larger than current priority")
+
+        self.priorities[i] = priority
+        self._sift_up(i)
+
+    def remove(self, item):
+        """
+        Remove an arbitrary item and return its priority.
+
+        Time: O(d log_d n)
+        Space: O(1)
+        """
+        return self._remove_at(self.position[item])[1]
+
+
+def benchmark_indexed_heap(n=20000, updates=60000, arities=(2, 4, 8), seed=0):
+    """
+    Compare IndexedDaryHeap with heapq + lazy deletion.
+
+    Workload (Dijkstra-like): push n items, apply random decrease-keys,
+    then pop everything. The heapq version pushes a duplicate entry per
+    update and skips stale entries on pop.
+
+    Returns: {label: seconds}
+    """
+    rng = random.Random(seed)
+    initial = [rng.randint(0, 10**6) for _ in range(n)]
+    changes = [(rng.randrange(n), rng.randint(0, 10**6)) for _ in range(updates)]
+    timings = {}
+
+    start = time.perf_counter()
+    heap = [(p, item) for item, p in enumerate(initial)]
+    heapq.heapify(heap)
+    best = list(initial)
+    for item, p in changes:
+        if p < best[item]:
+            best[item] = p
+            heapq.heappush(heap, (p, item))
+    peak = len(heap)
+    done = bytearray(n)
+    while heap:
+        p, item = heapq.heappop(heap)
+        if done[item] or p != best[item]:
+            continue  # Stale duplicate
+        done[item] = 1
+    timings[f"heapq lazy ({peak} entries for {n} items)"] = time.perf_counter() - start
+
+    for d in arities:
+        start = time.perf_counter()
+        pq = IndexedDaryHeap(d)
+        for item, p in enumerate(initial):
+            pq.push(item, p)
+        for item, p in changes:
+            if p < pq.priorities[pq.position[item]]:
+                pq.decrease_key(item, p)
+        while pq:
+            pq.pop()
+        timings[f"indexed d={d}"] = time.perf_counter() - start
+
+    return timings
+
+
+# ============================================================================
+# PATTERN 7: DELAY QUEUE (HIERARCHICAL TIMER WHEEL)
+# ============================================================================
+
+
+class TimerHandle:
+    """A scheduled task; cancel() marks it so the wheel skips it."""
+
+    __slots__ = ("deadline", "task", "cancelled", "fired")
+
+    def __init__(self, deadline, task):
+        self.deadline = deadline
+        self.task = task
+        self.cancelled = False
+        self.fired = False
+
+
+class HierarchicalTimerWheel:
+    """
+    Delay queue built from FIFO buckets arranged as nested clock wheels.
+
+    A heap pays O(log n) per timer. A timer wheel is a ring of queues
+    indexed by time: level 0 has one slot per tick, level 1 one slot per
+    wheel_size ticks, level 2 one per wheel_size² ticks, and so on.
+    Writing a deadline in base wheel_size, a timer goes to the level of
+    the highest digit where it differs from the current time, in the slot
+    named by that digit. When the clock reaches that slot, its timers are
+    cascaded down to finer levels, or fired if they are due.
+
+    Time: schedule/cancel O(1), advance O(due timers + cascades)
+    Space: O(levels * wheel_size + timers)
+
+    Example: wheel = HierarchicalTimerWheel(wheel_size=8, levels=3)
+             wheel.schedule(5, "retry"); wheel.schedule(100, "timeout")
+             wheel.advance(5) → ["retry"]
+             wheel.advance(100) → ["timeout"]
+    """
+
+    def __init__(self, wheel_size=64, levels=4, start=0):
+        self.size = wheel_size
+        self.levels = levels
+        self.current = start  # Last processed tick
+        self.wheels = [[deque() for _ in range(wheel_size)] for _ in range(levels)]
+        self.level_counts = [0] * levels
+        self.ready = deque()  # Scheduled at or before the current tick
+        self.overflow = deque()  # Beyond the top wheel's horizon
+        self.active = 0
+
+    def __len__(self):
+        return self.active
+
+    def _place(self, handle):
+        """Put a timer in the bucket matching its deadline."""
+        deadline, now = handle.deadline, self.current
+        if deadline <= now:
+            self.ready.append(handle)
+            return
+
+        # Highest base-size digit where deadline and current time differ
+        span = 1
+        for level in range(self.levels):
+            if deadline // (span * self.size) == now // (span * self.size):
+                slot = (deadline // span) % self.size
+                self.wheels[level][slot].append(handle)
+                self.level_counts[level] += 1
+                return
+            span *= self.size
+
+        self.overflow.append(handle)
+
+    def schedule_at(self, deadline, task):
+        """
+        Schedule task to fire at an absolute tick.
+
+        Time: O(levels) - constant for a fixed wheel shape
+        Space: O(1)
+        """
+        handle = TimerHandle(deadline, task)
+        self._place(handle)
+        self.active += 1
+        return handle
+
+    def schedule(self, delay, task):
+        """
+        Schedule task to fire `delay` ticks from now.
+
+        Time: O(1)
+        Space: O(1)
+        """
+        return self.schedule_at(self.current + delay, task)
+
+    def cancel(self, handle):
+        """
+        Cancel a timer; its bucket entry is skipped when reached.
+
+        Cancelling a timer that already fired or was already cancelled is
+        a no-op (the usual "clear the timeout after the reply" pattern).
+
+        Returns: True if the timer was pending and is now cancelled
+
+        Time: O(1)
+        Space: O(1)
+        """
+        if handle.cancelled or handle.fired:
+            return False
+        handle.cancelled = True
+        self.active -= 1
+        return True
+
+    def next_expiry(self):
+        """
+        Tick of the next non-empty slot (a fire or a cascade), or None.
+
+        Time: O(levels * wheel_size)
+        Space: O(1)
+        """
+        if self.ready:
+            return self.current
+
+        span = 1
+        for level in range(self.levels):
+            if self.level_counts[level]:
+                block = self.current // (span * self.size) * (span * self.size)
+                digit = (self.current // span) % self.size
+                for slot in range(digit + 1, self.size):
+                    if self.wheels[level][slot]:
+                        return block + slot * span
+            span *= self.size
+
+        if self.overflow:
+            return (self.current // span + 1) * span
+        return None
+
+    def _process_tick(self, tick, fired):
+        """Cascade every wheel that rolls over at tick, then fire level 0."""
+        self.current = tick
+        top_span = self.size**self.levels
+
+        if tick % top_span == 0:
+            for _ in range(len(self.overflow)):
+                self._cascade_one(self.overflow.popleft(), fired)
+
+        span = self.size ** (self.levels - 1)
+        for level in range(self.levels - 1, -1, -1):
+            if tick % span == 0:
+                bucket = self.wheels[level][(tick // span) % self.size]
+                self.level_counts[level] -= len(bucket)
+                for _ in range(len(bucket)):
+                    self._cascade_one(bucket.popleft(), fired)
+            span //= self.size
+
+    def _cascade_one(self, handle, fired):
+        """Fire a due timer or move it to a finer wheel."""
+        if handle.cancelled:
+            return
+        if handle.deadline <= self.current:
+            handle.fired = True
+            self.active -= 1
+            fired.append(handle.task)
+        else:
+            self._place(handle)
+
+    def advance(self, now):
+        """
+        Move the clock to tick `now` and return all due tasks as a batch.
+
+        Empty stretches are skipped by jumping to the next non-empty slot,
+        so idle periods cost nothing.
+
+        Time: O(due + cascaded timers) plus O(levels * wheel_size) per jump
+        Space: O(due)
+        """
+        fired = []
+        while self.ready:
+            self._cascade_one(self.ready.popleft(), fired)
+
+        while True:
+            tick = self.next_expiry()
+            if tick is None or tick > now:
+                break
+            self._process_tick(tick, fired)
+            while self.ready:
+                self._cascade_one(self.ready.popleft(), fired)
+
+        self.current = max(self.current, now)
+        return fired
+
+
+class AsyncTimerWheel:
+    """
+    asyncio driver for HierarchicalTimerWheel.
+
+    run() sleeps until the next non-empty slot instead of waking every
+    tick; scheduling an earlier timer wakes it up early. Due callbacks
+    are called in one batch per wake-up.
+
+    Example: timers = AsyncTimerWheel(tick=0.01)
+             timers.schedule(0.5, print, "retry")
+             await timers.run_until_idle()
+    """
+
+    def __init__(self, tick=0.01, wheel_size=64, levels=4):
+        self.tick = tick
+        self.origin = time.monotonic()
+        self.wheel = HierarchicalTimerWheel(wheel_size, levels)
+        self.wakeup = asyncio.Event()
+
+    def _now_tick(self):
+        return int((time.monotonic() - self.origin) / self.tick)
+
+    def schedule(self, delay, callback, *args):
+        """Call callback(*args) after `delay` seconds (rounded up to a tick)."""
+        deadline = self._now_tick() + max(1, math.ceil(delay / self.tick))
+        handle = self.wheel.schedule_at(deadline, (callback, args))
+        self.wakeup.set()
+        return handle
+
+    def cancel(self, handle):
+        return self.wheel.cancel(handle)
+
+    async def run_until_idle(self):
+        """Fire timers as they come due; return once none are pending."""
+        while len(self.wheel):
+            self.wakeup.clear()
+            for callback, args in self.wheel.advance(self._now_tick()):
+                callback(*args)
+
+            next_tick = self.wheel.next_expiry()
+            if next_tick is None:
+                continue
+            delay = (next_tick + 1) * self.tick - (time.monotonic() - self.origin)
+            try:
+                await asyncio.wait_for(self.wakeup.wait(), timeout=max(0, delay))
+            except asyncio.TimeoutError:
+                pass
+
+
 # ============================================================================
 # HELPER FUNCTIONS
 # ============================================================================
@@ -909,6 +2176,15 @@ if __name__ == "__main__":
         result = is_valid_parentheses(test)
         print(f"'{test}' → {result}")
 
+    # Streaming and Parallel Parentheses
+    print("\n--- Streaming / Parallel Parentheses ---")
+    print(f"Stream ['([', ']{{', '}})'] → {is_valid_parentheses_stream(['([', ']{', '})'])}")
+    with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False) as doc:
+        doc.write("([{" * 5000 + "x" + "}])" * 5000)
+    print(f"Streamed file valid: {is_valid_parentheses_stream(iter_file_chunks(doc.name, 4096))}")
+    print(f"Parallel file valid: {is_valid_parentheses_parallel(doc.name, workers=2, chunk_size=4096)}")
+    os.remove(doc.name)
+
     # Monotonic Stack - Next Greater Element
     print("\n--- Next Greater Element ---")
     nums = [1, 5, 0, 3, 4, 5]
@@ -923,6 +2199,13 @@ if __name__ == "__main__":
     print(f"Input: {temps}")
     print(f"Output: {result}")
 
+    # Chunk-Parallel Monotonic Stack
+    print("\n--- Chunk-Parallel Next Greater / Daily Temperatures ---")
+    print(f"Next greater (chunks of 2): {next_greater_element_parallel([1, 5, 0, 3, 4, 5], chunk_size=2)}")
+    print(f"Daily temps (2 processes): {daily_temperatures_parallel(temps, workers=2, chunk_size=3)}")
+    timings = benchmark_parallel_monotonic(200_000, process_counts=(1, 2, 4))
+    print("Scaling: " + ", ".join(f"{k} {v:.3f}s" for k, v in timings.items()))
+
     # Min Stack
     print("\n--- Min Stack ---")
     min_stack = MinStack()
@@ -959,6 +2242,25 @@ if __name__ == "__main__":
     area = largest_rectangle_in_histogram(heights)
     print(f"Heights: {heights}")
     print(f"Largest rectangle area: {area}")
+    print(f"With bounds (area, left, right, height): {largest_rectangle_with_bounds(heights)}")
+
+    # Maximal Rectangle
+    print("\n--- Maximal Rectangle in Binary Matrix ---")
+    matrix = [
+        [1, 0, 1, 0, 0],
+        [1, 0, 1, 1, 1],
+        [1, 1, 1, 1, 1],
+        [1, 0, 0, 1, 0],
+    ]
+    try:
+        import numpy as np
+
+        print(f"Largest block of 1s: {maximal_rectangle(matrix)}")
+        print(f"Largest empty region: {maximal_rectangle(matrix, target=0)}")
+        packed = np.packbits(np.array(matrix, dtype=np.uint8), axis=1)
+        print(f"Bit-packed input: {maximal_rectangle(packed, packed_width=5)}")
+    except ImportError:
+        print("(numpy not installed, skipping maximal rectangle)")
 
     print("\n" + "=" * 70)
     print("QUEUE OPERATIONS")
@@ -999,6 +2301,18 @@ if __name__ == "__main__":
         count = counter.ping(ping)
         print(f"ping({ping}) → {count}")
 
+    # Bucketed Recent Counter
+    print("\n--- Bucketed Recent Counter (fixed memory) ---")
+    bucketed = BucketedRecentCounter(window=3000, buckets=30)
+    for ping in test_pings:
+        count = bucketed.ping(ping)
+        print(f"ping({ping}) → {count} (buckets={len(bucketed.counts)})")
+
+    limiter = KeyedRateCounter(window=3000, buckets=30)
+    for key, t in [("alice", 10), ("bob", 12), ("alice", 20), ("alice", 5000)]:
+        print(f"ping({key!r}, {t}) → {limiter.ping(key, t)}")
+    print(f"Pruned idle keys at t=9000: {limiter.prune(9000)}")
+
     # Max Consecutive Ones III
     print("\n--- Max Consecutive Ones III ---")
     nums = [1, 1, 1, 0, 0, 0, 1, 1, 1, 1, 0]
@@ -1007,6 +2321,24 @@ if __name__ == "__main__":
     print(f"Input: {nums}, k={k}")
     print(f"Output: {result}")
 
+    # Streaming Window Generators
+    print("\n--- Streaming Window Generators ---")
+    readings = (x if x % 4 else -x for x in range(1, 13))  # Lazy sensor stream
+    first_negatives = first_negative_in_window_stream(readings, 3)
+    pipeline = sliding_window_maximum_stream(first_negatives, 2)
+    print(f"Max of first negatives (k=3 then k=2): {list(pipeline)}")
+    stream_result = list(max_consecutive_ones_iii_stream(iter(nums), k))
+    print(f"Max consecutive ones so far: {stream_result}")
+
+    # Sliding Window Median / Percentiles
+    print("\n--- Sliding Window Median / Percentiles ---")
+    samples = [1, 3, -1, -3, 5, 3, 6, 7]
+    print(f"Medians (k=3): {sliding_window_median(samples, 3)}")
+    print(f"Medians (k=4): {sliding_window_median(samples, 4)}")
+    latencies = (i * 37 % 101 for i in range(500))
+    rolling = list(sliding_window_quantile_stream(latencies, 100, q=(0.5, 0.95, 0.99)))
+    print(f"Rolling p50/p95/p99 (k=100): first {rolling[0]}, last {rolling[-1]}")
+
     print("\n" + "=" * 70)
     print("BFS WITH QUEUE")
     print("=" * 70)
@@ -1041,6 +2373,44 @@ if __name__ == "__main__":
     print(f"Grid: {grid}")
     print(f"Shortest path distance: {result}")
 
+    print("\n" + "=" * 70)
+    print("PRIORITY QUEUE")
+    print("=" * 70)
+
+    # Indexed d-ary Heap
+    print("\n--- Indexed d-ary Heap ---")
+    pq = IndexedDaryHeap(d=4)
+    for job, priority in [("backup", 5), ("email", 3), ("report", 8), ("alert", 9)]:
+        pq.push(job, priority)
+    pq.decrease_key("alert", 1)
+    pq.remove("report")
+    print(f"Peek: {pq.peek()}")
+    print(f"Pop order: {[pq.pop() for _ in range(len(pq))]}")
+    timings = benchmark_indexed_heap(n=5000, updates=15000)
+    print("Benchmark: " + ", ".join(f"{k} {v:.3f}s" for k, v in timings.items()))
+
+    # Hierarchical Timer Wheel
+    print("\n--- Hierarchical Timer Wheel ---")
+    wheel = HierarchicalTimerWheel(wheel_size=8, levels=3)
+    for delay, job in [(5, "retry-1"), (5, "retry-2"), (100, "timeout"), (700, "lease")]:
+        handle = wheel.schedule(delay, job)
+    wheel.cancel(handle)  # Cancel the lease
+    for now in (4, 5, 99, 100, 1000):
+        print(f"advance({now}) → {wheel.advance(now)}")
+
+    # Clearing a timeout after it already fired must not corrupt the count
+    handle = wheel.schedule(1, "reply-timeout")
+    wheel.advance(wheel.current + 1)
+    print(f"Cancel after fire: {wheel.cancel(handle)}, pending: {len(wheel)}")  # False, 0
+
+    fired_order = []
+    timers = AsyncTimerWheel(tick=0.005)
+    timers.schedule(0.03, fired_order.append, "slow")
+    fast = timers.schedule(0.01, fired_order.append, "fast")
+    asyncio.run(timers.run_until_idle())
+    print(f"asyncio fired: {fired_order}")
+    print(f"Cancel fired timer: {timers.cancel(fast)}, pending: {len(timers.wheel)}")  # False, 0
+
     print("\n" + "=" * 70)
     print("DEQUE EXAMPLES")
     print("=" * 70)
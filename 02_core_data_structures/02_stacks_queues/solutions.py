@@ -5,7 +5,16 @@ Complete solutions with explanations for all exercises.
 Study the approach and complexity analysis for each problem.
 """
 
+import heapq
+import operator
+import os
+import struct
+import time
+from array import array
 from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import compress, count, islice, repeat
 
 # ============================================================================
 # EXERCISE 1: Implement Stack using list
@@ -442,6 +451,254 @@ def eval_rpn(tokens):
     return stack[0]
 
 
+RPN_OPERATORS = {
+    "+": operator.add,
+    "-": operator.sub,
+    "*": operator.mul,
+    "/": lambda a, b: int(a / b),  # Truncate toward zero, like eval_rpn
+}
+
+RPN_PUSH_CONST, RPN_PUSH_VAR, RPN_APPLY = 0, 1, 2
+
+
+def compile_rpn(tokens):
+    """
+    Compile RPN tokens into a reusable evaluation plan.
+
+    eval_rpn re-parses every token (operator check + int()) on each call.
+    When the same formula runs millions of times with different inputs,
+    do that work once and return a flat instruction array instead.
+
+    Example: plan = compile_rpn(["x", "1", "+", "y", "*"])
+             plan({"x": 2, "y": 3}) → 9
+             plan({"x": 4, "y": 5}) → 25
+
+    Approach:
+    - Numbers become (PUSH_CONST, value)
+    - Identifiers become (PUSH_VAR, name), looked up at run time
+    - Operators become (APPLY, function), resolved once
+    - Simulate stack depth at compile time so malformed expressions
+      raise ValueError here instead of failing mid-evaluation
+
+    Key Insight:
+    - A flat list keeps evaluation iterative (no recursion limit for long
+      expressions) and the hot loop does no string work at all
+
+    Time: O(n) to compile, O(n) per evaluation with a small constant
+    Space: O(n) for the plan
+    """
+    code = []
+    depth = 0
+
+    for token in tokens:
+        if token in RPN_OPERATORS:
+            if depth < 2:
+                raise ValueError(f"operator {token!r} needs two operands")
+            code.append((RPN_APPLY, RPN_OPERATORS[token]))
+            depth -= 1
+        elif token.isidentifier():
+            code.append((RPN_PUSH_VAR, token))
+            depth += 1
+        else:
+            code.append((RPN_PUSH_CONST, int(token)))
+            depth += 1
+
+    if depth != 1:
+        raise ValueError("expression must leave exactly one value")
+
+    code = tuple(code)
+
+    def plan(variables=None):
+        stack = []
+        push = stack.append
+        pop = stack.pop
+
+        for op, arg in code:
+            if op == RPN_APPLY:
+                b = pop()
+                stack[-1] = arg(stack[-1], b)
+            elif op == RPN_PUSH_CONST:
+                push(arg)
+            else:
+                push(variables[arg])
+
+        return stack[0]
+
+    plan.code = code
+    return plan
+
+
+@lru_cache(maxsize=1024)
+def _cached_plan(expression):
+    """LRU of compiled plans keyed by the expression's token tuple."""
+    return compile_rpn(expression)
+
+
+def eval_rpn_cached(tokens, variables=None):
+    """
+    Evaluate RPN tokens using a cached compiled plan.
+
+    The first call for an expression compiles it; later calls (with any
+    variable bindings) reuse the plan from the LRU.
+
+    Example: eval_rpn_cached(["a", "b", "-"], {"a": 7, "b": 2}) → 5
+
+    Time: O(n) on a cache miss, then one plan evaluation per call
+    Space: O(n) per cached plan, up to 1024 plans
+    """
+    return _cached_plan(tuple(tokens))(variables)
+
+
+def _truncating_divide(np, a, b):
+    """Integer division toward zero on arrays, matching int(a / b)."""
+    if np.any(np.asarray(b) == 0):
+        raise ZeroDivisionError("division by zero")
+
+    q = np.floor_divide(a, b)
+    # Floor and truncation differ only for inexact negative quotients
+    return q + ((np.remainder(a, b) != 0) & ((np.asarray(a) < 0) != (np.asarray(b) < 0)))
+
+
+def _checked_int64_apply(np, fn, a, b):
+    """
+    Apply an RPN operator to int64 arrays, raising OverflowError instead of
+    letting the result wrap around.
+    """
+    a = np.asarray(a, dtype=np.int64)
+    b = np.asarray(b, dtype=np.int64)
+    smallest = np.iinfo(np.int64).min
+
+    with np.errstate(all="ignore"):
+        if fn is operator.add:
+            result = a + b
+            overflow = ((a ^ result) & (b ^ result)) < 0
+        elif fn is operator.sub:
+            result = a - b
+            overflow = ((a ^ b) & (a ^ result)) < 0
+        elif fn is operator.mul:
+            result = a * b
+            nonzero = np.where(a == 0, 1, a)
+            overflow = (a != 0) & ((result // nonzero != b) | ((a == -1) & (b == smallest)))
+        else:
+            overflow = (a == smallest) & (b == -1)
+            result = _truncating_divide(np, a, b)
+
+    if np.any(overflow):
+        raise OverflowError("int64 overflow")
+    return result
+
+
+def _eval_rpn_chunk(np, code, columns, start, stop, exact):
+    """Run the plan on rows [start, stop): int64, or Python ints if exact."""
+    divide = RPN_OPERATORS["/"]
+    stack = []
+
+    for op, arg in code:
+        if op == RPN_APPLY:
+            b = stack.pop()
+            a = stack.pop()
+            if not exact:
+                stack.append(_checked_int64_apply(np, arg, a, b))
+            elif arg is divide:
+                stack.append(_truncating_divide(np, a, b))
+            else:
+                stack.append(arg(a, b))
+        elif op == RPN_PUSH_CONST:
+            stack.append(np.array(arg, dtype=object) if exact else np.int64(arg))
+        else:
+            values = columns[arg][start:stop]
+            if exact:
+                stack.append(np.array([int(v) for v in values], dtype=object))
+            else:
+                stack.append(np.asarray(values, dtype=np.int64))
+
+    return stack[0]
+
+
+def eval_rpn_columns(tokens, columns, chunk_size=1_000_000):
+    """
+    Evaluate one RPN formula over whole columns with NumPy.
+
+    Calling eval_rpn once per row pays the interpreter cost n times.
+    Instead run the stack machine once per chunk, with NumPy arrays as the
+    stack operands, so every operator processes a whole column slice.
+
+    Example: eval_rpn_columns(["x", "1", "+", "y", "*"],
+                              {"x": [2, -7], "y": [3, 2]}) → array([9, -12])
+
+    Approach:
+    - Reuse the compiled plan from compile_rpn (cached per expression)
+    - Run it on slices of chunk_size rows, writing into one output array
+    - "/" uses floor division plus a correction, so results match
+      eval_rpn's int(a / b) truncation toward zero
+    - Every int64 operator is overflow-checked; a chunk that would wrap
+      is recomputed with exact Python ints and the output switches to
+      dtype=object (slower, but never wrong)
+
+    Note: requires numpy. Columns can be lists, arrays or np.memmap;
+    only one chunk of each column is converted at a time. All columns
+    must have the same length (ValueError otherwise).
+
+    Time: O(n * m) with m tokens, but vectorized per chunk
+    Space: O(chunk_size * depth) working memory plus O(n) output
+    """
+    import numpy as np
+
+    code = _cached_plan(tuple(tokens)).code
+    lengths = {len(column) for column in columns.values()}
+    if len(lengths) > 1:
+        raise ValueError(f"columns have different lengths: {sorted(lengths)}")
+    n = lengths.pop() if lengths else 1
+    out = np.empty(n, dtype=np.int64)
+
+    for start in range(0, n, chunk_size):
+        stop = min(start + chunk_size, n)
+        try:
+            if out.dtype == object:
+                raise OverflowError
+            result = _eval_rpn_chunk(np, code, columns, start, stop, exact=False)
+        except OverflowError:
+            if out.dtype != object:
+                out = out.astype(object)
+            result = _eval_rpn_chunk(np, code, columns, start, stop, exact=True)
+
+        # Broadcast in case the formula has no variables
+        out[start:stop] = result
+
+    return out
+
+
+def benchmark_compiled_rpn(tokens, bindings, repeat=3):
+    """
+    Compare repeated eval_rpn against a compiled plan.
+
+    eval_rpn has no variables, so each binding is substituted into the
+    tokens first (which is what callers have to do today).
+
+    Returns: (eval_rpn_seconds, compiled_seconds) best of `repeat` runs
+    """
+
+    def run_eval_rpn():
+        for env in bindings:
+            eval_rpn([str(env[t]) if t in env else t for t in tokens])
+
+    def run_compiled():
+        plan = compile_rpn(tokens)
+        for env in bindings:
+            plan(env)
+
+    timings = []
+    for fn in (run_eval_rpn, run_compiled):
+        best = float("inf")
+        for _ in range(repeat):
+            start = time.perf_counter()
+            fn()
+            best = min(best, time.perf_counter() - start)
+        timings.append(best)
+
+    return tuple(timings)
+
+
 # ============================================================================
 # EXERCISE 8: Implement Queue using Stacks
 # ============================================================================
@@ -858,6 +1115,168 @@ def trap_rain_water(height):
     return water
 
 
+_SIGN_BITS = (1 << 63) - 1
+
+
+def _float_to_ordered_key(x):
+    """
+    Map a float to an int64 with the same order: reinterpret its bits, then
+    flip the magnitude bits of negatives so more negative → smaller.
+    """
+    key = struct.unpack("<q", struct.pack("<d", x))[0]
+    return key ^ _SIGN_BITS if key < 0 else key
+
+
+def _ordered_key_to_float(key):
+    """Inverse of _float_to_ordered_key."""
+    if key < 0:
+        key ^= _SIGN_BITS
+    return struct.unpack("<d", struct.pack("<q", key))[0]
+
+
+def trap_rain_water_2d(height_map):
+    """
+    Calculate water trapped on a 2-D elevation grid (priority flood).
+
+    Example: [[1,4,3,1,3,2],
+              [3,2,1,3,2,4],
+              [2,3,3,2,3,1]] → 4
+
+    Approach:
+    - Water can always escape over the border, so start from border cells
+    - Min-heap ordered by water level: always grow from the lowest wall
+    - Popped cell with level L: an unvisited neighbor lower than L holds
+      L - height water; push the neighbor with level max(L, height)
+
+    Compact storage (no per-cell tuples):
+    - Heights and depths live in flat buffers, index r*cols+c:
+      array('q') for integer elevations, array('d') once any is a float
+      (e.g. a DEM) - values are never truncated
+    - Every level has an int key: the height itself for integer grids,
+      an order-preserving int64 image of the float bits otherwise
+    - Heap entries are single ints: (key - min_key) * cells + index
+    - Visited flags are one bytearray
+
+    height_map may be a list of lists or any 2-D array, including a
+    memory-mapped numpy array (rows are read one at a time).
+
+    Key Insight:
+    - The 1-D two-pointer idea generalizes: the lowest boundary cell
+      decides how high water can rise next to it
+
+    Returns: (total water, depth) where depth[r * cols + c] is water depth
+
+    Time: O(n log n) for n cells
+    Space: O(n) compact buffers
+    """
+    rows = len(height_map)
+    cols = len(height_map[0]) if rows else 0
+    cells = rows * cols
+
+    try:
+        heights = array("q")
+        for row in height_map:
+            heights.extend(row)  # TypeError on the first non-integer height
+    except TypeError:
+        heights = array("d")
+        for row in height_map:
+            heights.extend(map(float, row))
+    integral = heights.typecode == "q"
+
+    depth = array(heights.typecode, bytes(8 * cells))
+    water = 0 if integral else 0.0
+    if rows < 3 or cols < 3:
+        return water, depth
+
+    if integral:
+        keys = heights
+    else:
+        if any(h != h for h in heights):
+            raise ValueError("height_map contains NaN")
+        # Same bytes read as int64, then negatives reordered
+        keys = array("q", heights.tobytes())
+        for i, key in enumerate(keys):
+            if key < 0:
+                keys[i] = key ^ _SIGN_BITS
+
+    base = min(keys)
+    visited = bytearray(cells)
+    heap = []
+
+    # All border cells are walls water can spill over
+    for r in range(rows):
+        for c in range(cols):
+            if r in (0, rows - 1) or c in (0, cols - 1):
+                idx = r * cols + c
+                visited[idx] = 1
+                heap.append((keys[idx] - base) * cells + idx)
+    heapq.heapify(heap)
+
+    while heap:
+        key, idx = divmod(heapq.heappop(heap), cells)
+        key += base
+        level = key if integral else _ordered_key_to_float(key)
+        r, c = divmod(idx, cols)
+
+        for nr, nc in ((r - 1, c), (r + 1, c), (r, c - 1), (r, c + 1)):
+            if 0 <= nr < rows and 0 <= nc < cols:
+                nidx = nr * cols + nc
+                if visited[nidx]:
+                    continue
+                visited[nidx] = 1
+
+                neighbor_key = keys[nidx]
+                if neighbor_key < key:
+                    depth[nidx] = level - heights[nidx]
+                    water += depth[nidx]
+                    neighbor_key = key
+                heapq.heappush(heap, (neighbor_key - base) * cells + nidx)
+
+    return water, depth
+
+    base = min(heights)
+
+    def entry(level, idx):
+        return (level - base) * cells + idx if integral else (level, idx)
+
+    visited = bytearray(cells)
+    heap = []
+
+    # All border cells are walls water can spill over
+    for r in range(rows):
+        for c in range(cols):
+            if r in (0, rows - 1) or c in (0, cols - 1):
+                idx = r * cols + c
+                visited[idx] = 1
+                heap.append(entry(heights[idx], idx))
+    heapq.heapify(heap)
+
+    while heap:
+        key = heapq.heappop(heap)
+        if integral:
+            level, idx = divmod(key, cells)
+            level += base
+        else:
+            level, idx = key
+        r, c = divmod(idx, cols)
+
+        for nr, nc in ((r - 1, c), (r + 1, c), (r, c - 1), (r, c + 1)):
+            if 0 <= nr < rows and 0 <= nc < cols:
+                nidx = nr * cols + nc
+                if visited[nidx]:
+                    continue
+                visited[nidx] = 1
+
+                h = heights[nidx]
+                if h < level:
+                    depth[nidx] = level - h
+                    water += level - h
+                    h = level
+                heapq.heappush(heap, entry(h, nidx))
+
+    return water, depth
+
+
 # ============================================================================
 # EXERCISE 14: Largest Rectangle in Histogram
 # ============================================================================
@@ -1019,6 +1438,130 @@ def asteroid_collision(asteroids):
     return stack
 
 
+def merge_asteroid_summaries(stack, right):
+    """
+    Merge a reduced chunk into the reduced asteroids to its left (in place).
+
+    A reduced chunk always looks like [left-movers..., right-movers...],
+    so only the left side's right-movers meet the right side's
+    left-movers. The right side's right-movers are appended unchanged.
+
+    Example: merge_asteroid_summaries([-2, 5, 10], [-7, -12, 3]) → [-2, -12, 3]
+
+    Time: O(collisions + len(right))
+    Space: O(1) extra
+    """
+    for i, asteroid in enumerate(right):
+        if asteroid > 0:
+            stack.extend(right[i:])
+            break
+
+        alive = True
+        while alive and stack and stack[-1] > 0:
+            top = stack[-1]
+            if top >= -asteroid:
+                alive = False
+                if top == -asteroid:
+                    stack.pop()
+            else:
+                stack.pop()
+
+        if alive:
+            stack.append(asteroid)
+
+    return stack
+
+
+def _iter_chunks(iterable, chunk_size):
+    """Lazily slice any iterable into lists of up to chunk_size items."""
+    it = iter(iterable)
+    while True:
+        chunk = list(islice(it, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def asteroid_collision_parallel(asteroids, workers=None, chunk_size=None):
+    """
+    Chunk-parallel asteroid_collision over a list or any iterable.
+
+    Example: asteroid_collision_parallel([5, 10, -5, 8, -8], chunk_size=2) → [5, 10]
+
+    Approach:
+    - Collision reduction is associative: reducing chunks first and then
+      the concatenated summaries gives the same result as one pass
+    - Slice the input lazily and reduce chunks with asteroid_collision in
+      a process pool, keeping at most 2 * workers chunks in flight
+    - Fold each summary into the result as soon as it is next in order,
+      with merge_asteroid_summaries
+
+    Time: O(n / workers) per process + O(n) merge in the worst case
+    Space: O(workers * chunk_size) in flight plus the surviving asteroids -
+           the input is never copied as a whole
+    """
+    workers = workers or os.cpu_count() or 1
+    if chunk_size is None:
+        n = len(asteroids) if hasattr(asteroids, "__len__") else 0
+        chunk_size = max(1, -(-n // workers)) if n else 1 << 16
+
+    chunks = _iter_chunks(asteroids, chunk_size)
+    result = []
+
+    if workers == 1:
+        for chunk in chunks:
+            merge_asteroid_summaries(result, asteroid_collision(chunk))
+        return result
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for chunk in chunks:
+            pending.append(pool.submit(asteroid_collision, chunk))
+            if len(pending) >= 2 * workers:
+                merge_asteroid_summaries(result, pending.popleft().result())
+        while pending:
+            merge_asteroid_summaries(result, pending.popleft().result())
+
+    return result
+
+
+def asteroid_collision_stream(asteroids):
+    """
+    Streaming asteroid_collision over any iterable.
+
+    Example: list(asteroid_collision_stream(iter([-1, 3, -2, -4, 6]))) → [-1, -4, 6]
+
+    Key Insight:
+    - A left-mover that survives with no right-movers to its left can
+      never collide again, so it is yielded immediately
+    - Only pending right-movers are kept; they are yielded at the end
+
+    Time: O(n)
+    Space: O(pending right-movers)
+    """
+    stack = []  # Right-moving asteroids only
+
+    for asteroid in asteroids:
+        if asteroid > 0:
+            stack.append(asteroid)
+            continue
+
+        alive = True
+        while alive and stack:
+            top = stack[-1]
+            if top >= -asteroid:
+                alive = False
+                if top == -asteroid:
+                    stack.pop()
+            else:
+                stack.pop()
+
+        if alive:
+            yield asteroid
+
+    yield from stack
+
+
 # ============================================================================
 # EXERCISE 16: Word Ladder II
 # ============================================================================
@@ -1273,6 +1816,181 @@ def create_binary_tree(values):
     return root
 
 
+class ArrayBinaryTree:
+    """
+    Binary tree stored as parallel arrays instead of TreeNode objects.
+
+    vals[i]          - value of node i (any type)
+    left[i]/right[i] - child indices in array('i'), -1 for null
+
+    Nodes are numbered in level order (root = 0), so every level is a
+    contiguous index range and BFS needs no queue at all.
+
+    Space: one list slot + 8 bytes of child indices per node, versus a
+    TreeNode object per node
+    """
+
+    def __init__(self, vals, left, right):
+        self.vals = vals
+        self.left = left
+        self.right = right
+
+    @classmethod
+    def from_level_order(cls, values):
+        """
+        Bulk build from a level-order list with None for null (same input
+        as create_binary_tree).
+
+        Time: O(n), Space: O(n)
+
+        Approach: Non-None entries get ids 0, 1, 2, ... in order. Entry
+        values[1 + slot] is the left (even slot) or right (odd slot) child of
+        node slot // 2, so no queue of nodes is needed.
+        """
+        if not values or values[0] is None:
+            return cls([], array("i"), array("i"))
+
+        vals = [values[0]]
+        n = sum(1 for v in values if v is not None)
+        left = array("i", [-1]) * n
+        right = array("i", [-1]) * n
+
+        present = map(operator.is_not, islice(values, 1, None), repeat(None))
+        for slot in compress(count(), present):
+            parent = slot >> 1
+            if parent >= len(vals):
+                break  # No parent left to attach to (as in create_binary_tree)
+            (right if slot & 1 else left)[parent] = len(vals)
+            vals.append(values[1 + slot])
+
+        del left[len(vals) :], right[len(vals) :]
+        return cls(vals, left, right)
+
+    @classmethod
+    def from_tree_node(cls, root):
+        """Convert a TreeNode tree, numbering nodes in level order"""
+        vals, left, right = [], array("i"), array("i")
+        queue = deque([root] if root else [])
+
+        while queue:
+            node = queue.popleft()
+            vals.append(node.val)
+            next_id = len(vals) + len(queue)
+            for child, side in ((node.left, left), (node.right, right)):
+                if child:
+                    side.append(next_id)
+                    queue.append(child)
+                    next_id += 1
+                else:
+                    side.append(-1)
+
+        return cls(vals, left, right)
+
+    def to_tree_node(self):
+        """Convert back to linked TreeNode objects"""
+        if not self.vals:
+            return None
+        nodes = [TreeNode(val) for val in self.vals]
+        for node, l, r in zip(nodes, self.left, self.right):
+            if l >= 0:
+                node.left = nodes[l]
+            if r >= 0:
+                node.right = nodes[r]
+        return nodes[0]
+
+    def __len__(self):
+        return len(self.vals)
+
+    def _levels(self):
+        """Yield (start, end) index range of each level"""
+        start, end = 0, len(self.vals) and 1
+        while start < end:
+            width = end - start
+            children = 2 * width - self.left[start:end].count(-1) - self.right[start:end].count(-1)
+            yield start, end
+            start, end = end, end + children
+
+    def level_order_traversal(self):
+        """
+        Time: O(n), Space: O(w)
+        Approach: Levels are contiguous - slice vals by level boundaries
+        """
+        return [self.vals[start:end] for start, end in self._levels()]
+
+    def right_side_view(self):
+        """
+        Time: O(n), Space: O(h)
+        Approach: Last index of each level range
+        """
+        return [self.vals[end - 1] for _, end in self._levels()]
+
+    def preorder(self):
+        """Time: O(n), Space: O(h) - explicit index stack"""
+        result, stack = [], [0] if self.vals else []
+        vals, left, right = self.vals, self.left, self.right
+        while stack:
+            i = stack.pop()
+            result.append(vals[i])
+            if right[i] >= 0:
+                stack.append(right[i])
+            if left[i] >= 0:
+                stack.append(left[i])
+        return result
+
+    def inorder(self):
+        """Time: O(n), Space: O(h) - go left, visit, then go right"""
+        result, stack = [], []
+        vals, left, right = self.vals, self.left, self.right
+        i = 0 if vals else -1
+        while stack or i >= 0:
+            while i >= 0:
+                stack.append(i)
+                i = left[i]
+            i = stack.pop()
+            result.append(vals[i])
+            i = right[i]
+        return result
+
+    def postorder(self):
+        """Time: O(n), Space: O(h) - reversed (root, right, left) preorder"""
+        result, stack = [], [0] if self.vals else []
+        vals, left, right = self.vals, self.left, self.right
+        while stack:
+            i = stack.pop()
+            result.append(vals[i])
+            if left[i] >= 0:
+                stack.append(left[i])
+            if right[i] >= 0:
+                stack.append(right[i])
+        result.reverse()
+        return result
+
+
+def benchmark_array_tree(n=10**6):
+    """
+    Build a complete tree of n nodes from level order and run BFS, with
+    create_binary_tree + level_order_traversal vs ArrayBinaryTree.
+
+    Returns: {name: (build_seconds, bfs_seconds)}
+    """
+    values = list(range(n))
+    results = {}
+
+    for name, build, bfs in (
+        ("TreeNode", create_binary_tree, level_order_traversal),
+        ("ArrayBinaryTree", ArrayBinaryTree.from_level_order, ArrayBinaryTree.level_order_traversal),
+    ):
+        start = time.perf_counter()
+        tree = build(values)
+        built = time.perf_counter()
+        levels = bfs(tree)
+        results[name] = (built - start, time.perf_counter() - built)
+        assert sum(map(len, levels)) == n
+        del tree
+
+    return results
+
+
 # ============================================================================
 # TESTING
 # ============================================================================
@@ -1362,6 +2080,32 @@ if __name__ == "__main__":
         status = "✓" if result == expected else "✗"
         print(f"{status} {tokens} → {result} (expected {expected})")
 
+    plan = compile_rpn(["x", "1", "+", "y", "*"])
+    for env, expected in [({"x": 2, "y": 3}, 9), ({"x": -7, "y": 2}, -12)]:
+        result = plan(env)
+        status = "✓" if result == expected else "✗"
+        print(f"{status} compiled (x + 1) * y with {env} → {result}")
+    result = eval_rpn_cached(["4", "x", "5", "/", "+"], {"x": -13})
+    status = "✓" if result == 2 else "✗"
+    print(f"{status} cached 4 + x / 5 with x=-13 → {result} (expected 2)")
+
+    formula = ["a", "b", "+", "c", "*", "d", "-", "2", "/"]
+    bindings = [{"a": i, "b": i + 1, "c": 3, "d": i % 7} for i in range(20000)]
+    slow, fast = benchmark_compiled_rpn(formula, bindings)
+    print(f"   {len(bindings)} evaluations: eval_rpn {slow:.3f}s, compiled {fast:.3f}s")
+
+    try:
+        columns = {"x": [2, -7, -13, 13], "y": [3, 2, 5, -5]}
+        result = eval_rpn_columns(["x", "y", "/", "1", "+"], columns, chunk_size=3)
+        expected = [eval_rpn([str(x), str(y), "/", "1", "+"]) for x, y in zip(*columns.values())]
+        status = "✓" if result.tolist() == expected else "✗"
+        print(f"{status} vectorized x / y + 1 → {result.tolist()} (expected {expected})")
+        result = eval_rpn_columns(["x", "x", "*"], {"x": [3, 2**40]})
+        status = "✓" if result.tolist() == [9, 2**80] else "✗"
+        print(f"{status} int64 overflow falls back to exact ints → {result.tolist()}")
+    except ImportError:
+        print("   (numpy not installed, skipping vectorized RPN)")
+
     # Exercise 8: Queue Using Stacks
     print("\n=== EXERCISE 8: Queue Using Stacks ===")
     queue_stack = QueueUsingStacks()
@@ -1404,6 +2148,18 @@ if __name__ == "__main__":
     print(f"{status} Output: {result}")
     print(f"   Expected: {expected}")
 
+    # Array-backed tree store
+    tree = ArrayBinaryTree.from_level_order([3, 9, 20, None, None, 15, 7])
+    result = tree.level_order_traversal()
+    status = "✓" if result == expected else "✗"
+    print(f"{status} Array-backed level order: {result}")
+    print(f"   Right side view: {tree.right_side_view()}")  # [3, 20, 7]
+    print(f"   Pre/in/post: {tree.preorder()} {tree.inorder()} {tree.postorder()}")
+    round_trip = level_order_traversal(tree.to_tree_node()) == result
+    print(f"{'✓' if round_trip else '✗'} TreeNode round trip")
+    for name, (build, bfs) in benchmark_array_tree(10**5).items():
+        print(f"   {name}: build {build:.3f}s, BFS {bfs:.3f}s")
+
     # Exercise 12: Recent Counter
     print("\n=== EXERCISE 12: Recent Counter ===")
     counter = RecentCounter()
@@ -1422,6 +2178,17 @@ if __name__ == "__main__":
     print(f"{status} Input: {height}")
     print(f"   Output: {result} (expected {expected})")
 
+    height_map = [[1, 4, 3, 1, 3, 2], [3, 2, 1, 3, 2, 4], [2, 3, 3, 2, 3, 1]]
+    result, depth = trap_rain_water_2d(height_map)
+    status = "✓" if result == 4 else "✗"
+    print(f"{status} 2-D grid → {result} (expected 4)")
+    print(f"   Depths: {[list(depth[r * 6:(r + 1) * 6]) for r in range(3)]}")
+
+    dem = [[2.5, 2.5, 2.5], [2.5, 1.2, 2.5], [2.5, 2.5, 2.5]]
+    result, depth = trap_rain_water_2d(dem)
+    status = "✓" if abs(result - 1.3) < 1e-9 else "✗"
+    print(f"{status} Float DEM pit → {result:.2f} (expected 1.30)")
+
     # Exercise 14: Largest Rectangle in Histogram
     print("\n=== EXERCISE 14: Largest Rectangle in Histogram ===")
     test_cases = [([2, 1, 5, 6, 2, 3], 10), ([2, 4], 4), ([1], 1)]
@@ -1439,6 +2206,15 @@ if __name__ == "__main__":
         print(f"{status} {asteroids} → {result}")
         print(f"   (expected {expected})")
 
+    asteroids = [5, 10, -5, 8, -8, -12, 3, 7, -6]
+    expected = asteroid_collision(asteroids)
+    result = asteroid_collision_parallel(asteroids, workers=2, chunk_size=3)
+    status = "✓" if result == expected else "✗"
+    print(f"{status} parallel {asteroids} → {result}")
+    result = list(asteroid_collision_stream(iter(asteroids)))
+    status = "✓" if result == expected else "✗"
+    print(f"{status} streaming → {result}")
+
     # Exercise 16: Word Ladder II
     print("\n=== EXERCISE 16: Word Ladder II ===")
     beginWord = "hit"
@@ -1466,3 +2242,4 @@ if __name__ == "__main__":
     print("\n" + "=" * 70)
     print("ALL TESTS COMPLETED")
     print("=" * 70)
+